@@ -8,7 +8,6 @@ setup(
     packages=find_packages(),
     install_requires=[
         "selenium",
-        "pyparsing",
     ],
     description="A custom Selenium driver package",
     author="Sunwoo Kim",
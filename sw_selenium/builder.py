@@ -1,11 +1,105 @@
 from __future__ import annotations
 
 import os
+import selectors
 import subprocess
 import sys
+import time
 from typing import Callable
 
 
+class _ExitWatcher:
+    """자식 프로세스들의 종료를 기다리는 헬퍼.
+
+    pidfd를 지원하는 환경(Linux 5.3+)에서는 selector로 종료 이벤트만 기다리고,
+    그렇지 않으면 poll_interval 간격으로 polling함.
+    polling할 때도 waitid를 지원하면 자식마다 poll하지 않고 한 번에 확인함.
+    """
+
+    poll_interval = 0.1
+
+    def __init__(self):
+        self._processes: dict[int, subprocess.Popen] = {}
+        self._pid_to_slot: dict[int, int] = {}
+        self._selector: selectors.BaseSelector | None = (
+            selectors.DefaultSelector() if hasattr(os, "pidfd_open") else None
+        )
+
+    def add(self, slot: int, process: subprocess.Popen):
+        self._processes[slot] = process
+        self._pid_to_slot[process.pid] = slot
+        if self._selector is None:
+            return
+
+        try:
+            fd = os.pidfd_open(process.pid)
+        except OSError:
+            # 커널이 pidfd를 지원하지 않음 -> polling으로 전환
+            self._close_selector()
+        else:
+            self._selector.register(fd, selectors.EVENT_READ, slot)
+
+    def wait(self) -> list[int]:
+        """하나 이상의 자식이 종료될 때까지 기다리고, 종료된 slot들을 반환합니다."""
+        while True:
+            if self._selector is not None:
+                exited = []
+                for key, _ in self._selector.select():
+                    self._selector.unregister(key.fd)
+                    os.close(key.fd)
+                    exited.append(key.data)
+            else:
+                exited = self._find_exited()
+
+            if exited:
+                for slot in exited:
+                    process = self._processes.pop(slot)
+                    self._pid_to_slot.pop(process.pid, None)
+                    process.wait()
+                return exited
+
+            time.sleep(self.poll_interval)
+
+    def close(self):
+        self._close_selector()
+        self._processes.clear()
+        self._pid_to_slot.clear()
+
+    def _find_exited(self) -> list[int]:
+        if not hasattr(os, "waitid"):
+            return [slot for slot, p in self._processes.items() if p.poll() is not None]
+
+        # WNOWAIT라서 reap하지 않고 확인만 함. reap해야 다음 자식이 보이므로 바로 wait함.
+        exited = []
+        while True:
+            try:
+                info = os.waitid(os.P_ALL, 0, os.WEXITED | os.WNOHANG | os.WNOWAIT)
+            except ChildProcessError:
+                return exited
+            if info is None:
+                return exited
+
+            slot = self._pid_to_slot.pop(info.si_pid, None)
+            if slot is None:
+                # 직접 띄우지 않은 자식 -> 모든 자식을 poll함
+                return exited + [
+                    slot
+                    for slot, p in self._processes.items()
+                    if slot not in exited and p.poll() is not None
+                ]
+
+            self._processes[slot].wait()
+            exited.append(slot)
+
+    def _close_selector(self):
+        if self._selector is None:
+            return
+        for key in list(self._selector.get_map().values()):
+            os.close(key.fd)
+        self._selector.close()
+        self._selector = None
+
+
 class _SwSeleniumBuilder:
     def start(
         self,
@@ -15,54 +109,50 @@ class _SwSeleniumBuilder:
         never_stop=False,
         on_success: Callable[[list[int]], None] | None = None,
     ):
-        """builder.start(__file__)"""
+        """builder.start(__file__)
+
+        on_success: 자식이 정상 종료될 때마다 한 번씩 호출됨.
+            인자는 종료된 그 자식의 return code 하나만 담은 목록. -> [0]
+        """
 
         if os.environ.get("ES_BUILD") == "1":
             return
 
         os.environ["ES_BUILD"] = "1"
+        # 재시작할 때마다 os.environ을 다시 복사하지 않도록 한 번만 만들어 둠
+        env = os.environ.copy()
 
-        processes: list = [None] * n
-        while True:
-            for i in range(n):
-                if processes[i] is None or processes[i].poll() is not None:
-                    if processes[i] is not None:
-                        return_code = processes[i].returncode
-                        if return_code != 0:
-                            if never_stop:
-                                print(
-                                    f"Process {i} failed with return code {return_code}. Restarting..."
-                                )
-                                processes[i] = subprocess.Popen(
-                                    [sys.executable, path],
-                                    stdin=sys.stdin,
-                                    stdout=sys.stdout,
-                                    stderr=sys.stderr,
-                                )
-                            else:
-                                print(
-                                    f"Process {i} failed with return code {return_code}. Exiting..."
-                                )
-                        else:
-                            if on_success:
-                                on_success(
-                                    [p.returncode for p in processes if p is not None]
-                                )
-                            processes[i] = None
-                    else:
-                        processes[i] = subprocess.Popen(
-                            [sys.executable, path],
-                            stdin=sys.stdin,
-                            stdout=sys.stdout,
-                            stderr=sys.stderr,
+        processes: list[subprocess.Popen] = [self._spawn(path, env) for _ in range(n)]
+        if not never_stop:
+            return
+
+        # 자식이 종료될 때만 깨어나서 해당 slot만 다시 실행함
+        watcher = _ExitWatcher()
+        try:
+            for i, process in enumerate(processes):
+                watcher.add(i, process)
+
+            while True:
+                for i in watcher.wait():
+                    return_code = processes[i].returncode
+                    if return_code != 0:
+                        print(
+                            f"Process {i} failed with return code {return_code}. Restarting..."
                         )
+                    elif on_success:
+                        # 정상 종료된 자식의 return code만 넘김 -> 자식마다 한 번씩 호출
+                        on_success([return_code])
 
-            if not never_stop:
-                break
+                    processes[i] = self._spawn(path, env)
+                    watcher.add(i, processes[i])
+        finally:
+            watcher.close()
 
-            for p in processes:
-                if p is not None:
-                    p.wait()
+    def _spawn(self, path, env: dict[str, str]):
+        # 표준 입출력은 그대로 상속하고 close_fds=False로 두면
+        # CPython이 fork+exec 대신 posix_spawn을 사용함.
+        # 파이썬이 만든 fd는 기본적으로 상속되지 않으므로 (PEP 446) fd가 새지 않음.
+        return subprocess.Popen([sys.executable, path], env=env, close_fds=False)
 
     def build(self, file_path: str, dist_path="."):
         """builder.build(__file__)
@@ -3,6 +3,9 @@ from __future__ import annotations
 import os
 import subprocess
 import sys
+from typing import Callable
+
+from .builder import _ExitWatcher
 
 
 class _SwSeleniumDebugger:
@@ -15,53 +18,62 @@ class _SwSeleniumDebugger:
             return
 
         os.environ["ES_DEBUG"] = "1"
+        # 재시작할 때마다 os.environ을 다시 복사하지 않도록 한 번만 만들어 둠
+        env = os.environ.copy()
+        # builder와 같이 pidfd로 종료를 기다림 (지원하지 않으면 polling)
+        watcher = _ExitWatcher()
         while True:
-            process = subprocess.Popen(
-                [sys.executable, path],
-                stdin=sys.stdin,
-                stdout=sys.stdout,
-                stderr=sys.stderr,
-            )
-            process.wait()
+            # 표준 입출력은 그대로 상속함 -> builder._spawn 참고
+            process = subprocess.Popen([sys.executable, path], env=env, close_fds=False)
+            watcher.add(0, process)
+            watcher.wait()
 
             if process.returncode == 1:
-                user_input = input("ES Debugger: An error occurred. [R]etry / [Q]uit: ")
-                while user_input.lower() not in ["r", "q"]:
-                    user_input = input()
-                user_input = user_input.lower()
-                if user_input == "r":
-                    continue
-
-                sys.exit(1)
+                self._ask(
+                    "ES Debugger: An error occurred. [R]etry / [Q]uit: ", _ERROR_ACTIONS
+                )
 
             elif process.returncode == self.QUIT_CODE:
                 print("The ES Debugger has terminated.")
                 sys.exit(0)
 
     def breakpoint(self):
-        user_input = input(
-            "ES Debugger: Breakpoint reached. [C]ontinue / [R]etry / [Q]uit: "
+        self._ask(
+            "ES Debugger: Breakpoint reached. [C]ontinue / [R]etry / [Q]uit: ",
+            _BREAK_ACTIONS,
         )
-        while user_input.lower() not in ["c", "r", "q"]:
-            user_input = input()
-        user_input = user_input.lower()
-        if user_input == "c":
-            return
-
-        if user_input == "r":
-            sys.exit(0)
-        elif user_input == "q":
-            sys.exit(self.QUIT_CODE)
 
     def end(self):
-        user_input = input("ES Debugger: End of the script. [R]etry / [Q]uit: ")
-        while user_input.lower() not in ["r", "q"]:
-            user_input = input()
-        user_input = user_input.lower()
-        if user_input == "r":
-            sys.exit(0)
-        elif user_input == "q":
-            sys.exit(self.QUIT_CODE)
+        self._ask("ES Debugger: End of the script. [R]etry / [Q]uit: ", _END_ACTIONS)
+
+    def _ask(self, message: str, actions: dict[str, Callable[[], None]]):
+        """message를 보여주고, 입력의 첫 글자에 해당하는 action을 실행합니다.
+        해당하는 action이 없으면 다시 물어봅니다.
+        """
+        while True:
+            action = actions.get(input(message).strip()[:1].casefold())
+            if action is not None:
+                return action()
+
+
+def _resume():
+    return
+
+
+def _retry_exit():
+    sys.exit(0)
+
+
+def _quit_exit():
+    sys.exit(_SwSeleniumDebugger.QUIT_CODE)
+
+
+def _error_exit():
+    sys.exit(1)
+
 
+_ERROR_ACTIONS = {"r": _resume, "q": _error_exit}
+_BREAK_ACTIONS = {"c": _resume, "r": _retry_exit, "q": _quit_exit}
+_END_ACTIONS = {"r": _retry_exit, "q": _quit_exit}
 
 debugger = _SwSeleniumDebugger()
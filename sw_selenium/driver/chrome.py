@@ -1,25 +1,33 @@
 from __future__ import annotations
 
+import logging
+import math
 import os
+import random
+import sys
 import threading
 import time
-from datetime import datetime
-from typing import TYPE_CHECKING, Callable, Literal
+from datetime import datetime, timedelta
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Literal
 
 import urllib3
 from selenium.common.exceptions import (
     NoSuchElementException,
     NoSuchWindowException,
+    StaleElementReferenceException,
     WebDriverException,
 )
 from selenium.webdriver import Chrome, ChromeOptions
 from selenium.webdriver.common.by import By
 
-from sw_selenium.parsing import convert_date_string, generate_xpath
-from sw_selenium.utils import LazyImport
+from sw_selenium.parsing import convert_date_string
+from sw_selenium.parsing.xpath_parser import _build_xpath
+from sw_selenium.utils import lazy_import
 
 from .context_finder import ContextFinder
-from .context_manager import NoException, RetryConfig
+from .context_manager import NewTab, NoException, RetryConfig
 from .element import SwElement
 from .elements import SwElements
 
@@ -28,13 +36,29 @@ if TYPE_CHECKING:
 
     from sw_selenium.parsing.xpath_parser import ExprStr
 else:
-    keyboard = LazyImport("keyboard")
+    keyboard = lazy_import("keyboard")
 
 
 # 이게 대체 뭔지 모르겠음
 # Warning이 뜨니깐...
 urllib3.disable_warnings()
 
+# debugger.start()가 자식 프로세스를 띄우기 전에 설정하므로 import 시점에 한 번만 읽음
+_ES_DEBUG = os.environ.get("ES_DEBUG") == "1"
+
+_log = logging.getLogger(__name__)
+
+
+def _enable_debug_log():
+    """디버그 모드에서 sw_selenium의 로그를 콘솔에 출력합니다. (핸들러는 한 번만 추가)"""
+    logger = logging.getLogger("sw_selenium")
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+
+
 SwOption = Literal[
     "keep_browser_open",
     "mute_audio",
@@ -45,6 +69,98 @@ SwOption = Literal[
     "disable_info_bar",
 ]
 
+_OPTION_ARGS = MappingProxyType(
+    {
+        "mute_audio": "--mute-audio",
+        "maximize": "--start-maximized",
+        "headless": "--headless",
+        "disable_popup": "--disable-popup-blocking",
+        "disable_info_bar": "--disable-infobars",
+    }
+)
+"""SwOption -> ChromeOptions().add_argument() 인자"""
+
+_OPTION_EXPERIMENTAL = MappingProxyType(
+    {
+        "keep_browser_open": ("detach", True),
+    }
+)
+"""SwOption -> ChromeOptions().add_experimental_option() 인자"""
+
+_OPTION_FLAGS = frozenset({"prevent_sleep", *_OPTION_EXPERIMENTAL})
+"""add_argument()로 넘기지 않는 SwOption"""
+
+
+@lru_cache(maxsize=32)
+def _resolve_options(
+    args: tuple[str, ...],
+) -> tuple[tuple[str, ...], tuple[tuple[str, object], ...]]:
+    """SwChrome(*args)를 (add_argument 인자들, add_experimental_option 인자들)로 변환합니다.
+    같은 옵션으로 여러 번 만드는 경우가 많으므로 옵션 조합마다 한 번만 변환함.
+    ChromeOptions 객체는 selenium이 수정하므로 공유하지 않음.
+    """
+    arguments = tuple(
+        _OPTION_ARGS.get(option, option)
+        for option in args
+        if option not in _OPTION_FLAGS
+    )
+    experimental = tuple(
+        _OPTION_EXPERIMENTAL[option]
+        for option in args
+        if option in _OPTION_EXPERIMENTAL
+    )
+    return arguments, experimental
+
+
+_RETRY_MIN_DELAY = 0.02
+"""retry의 첫 재시도 간격 (초 단위)"""
+
+_RETRY_BACKOFF = 1.3
+"""retry의 재시도 간격이 늘어나는 배율"""
+
+_RETRY_JITTER = 0.2
+"""retry의 재시도 간격에 더하는 무작위 비율 (0.2 -> 최대 20% 더 기다림)"""
+
+_FIND_CACHE_SIZE = 256
+"""SwChrome의 find 캐시에 저장할 최대 xpath 개수"""
+
+_HTTP_POOL_SIZE = 4
+"""chromedriver와의 HTTP 연결 풀에 보관할 최대 연결 수"""
+
+
+def _seconds_of_day(value: datetime) -> float:
+    """datetime의 시간 부분을 자정부터의 초로 변환합니다."""
+    return (
+        value.hour * 3600 + value.minute * 60 + value.second + value.microsecond / 1e6
+    )
+
+
+_FrameOp = tuple[Literal["root", "parent", "index", "name"], "int | str | None"]
+
+
+@lru_cache(maxsize=128)
+def _compile_frame_path(path: str) -> tuple[_FrameOp, ...]:
+    """goto_frame의 경로를 (동작, 값) 튜플로 변환합니다.
+    같은 경로를 반복해서 쓰는 경우가 많으므로 경로마다 한 번만 파싱함.
+    """
+    ops: list[_FrameOp] = []
+    nodes = path.split("/")
+    if nodes[0] == "":
+        ops.append(("root", None))
+
+    for node in nodes:
+        if node in ("", "."):
+            continue
+        if node == "..":
+            ops.append(("parent", None))
+        elif node.isdigit():
+            ops.append(("index", int(node)))
+        else:
+            ops.append(("name", node))
+
+    return tuple(ops)
+
+
 ChromeOptionArg = str
 """ChromeOptions().add_argument() 메서드의 인자 타입
 예)
@@ -62,6 +178,7 @@ class SwChrome(Chrome):
         *args: SwOption | ChromeOptionArg,
         timeout=5.0,
         freq=0.5,
+        cache_ttl=0.0,
         **kwargs: ChromeExperimentalOption,
     ):
         """SwChrome 클래스의 초기화 메서드.
@@ -69,6 +186,7 @@ class SwChrome(Chrome):
         Args:
             timeout (float, optional): WebDriver의 기본 타임아웃 시간 (초 단위). 기본값은 5.0.
             freq (float, optional): WebDriver의 폴링 빈도 (초 단위). 기본값은 0.5.
+            cache_ttl (float, optional): find, find_or_none, find_all 결과를 캐시할 시간 (초 단위). 기본값은 0.0. -> 0이면 캐시하지 않음
             keep_browser_open (bool, optional): 코드 실행 후 브라우저 창을 계속 열어둘지 여부. 기본값은 True.
             audio (bool, optional): 브라우저의 오디오를 음소거할지 여부. 기본값은 False.
             maximize (bool, optional): 브라우저 창을 최대화할지 여부. 기본값은 True.
@@ -87,50 +205,99 @@ class SwChrome(Chrome):
 
         """
 
-        self.debug = os.environ.get("ES_DEBUG") == "1"
+        self.debug = _ES_DEBUG
+        if self.debug:
+            _enable_debug_log()
         options = ChromeOptions()
 
-        prevent_sleep = False
-        keep_browser_open = False
-
-        option_map = {
-            "mute_audio": "--mute-audio",
-            "maximize": "--start-maximized",
-            "headless": "--headless",
-            "disable_popup": "--disable-popup-blocking",
-            "disable_info_bar": "--disable-infobars",
-        }
-
-        for option in args:
-            if option == "prevent_sleep":
-                prevent_sleep = True
-            elif option == "keep_browser_open":
-                keep_browser_open = True
-            else:
-                options.add_argument(option_map.get(option) or option)
+        prevent_sleep = "prevent_sleep" in args
 
-        if keep_browser_open:
-            options.add_experimental_option("detach", value=True)
+        # add_argument를 하나씩 부르지 않고 한 번에 추가함
+        arguments, experimental = _resolve_options(args)
+        options.arguments.extend(arguments)
+        for key, value in experimental:
+            options.add_experimental_option(key, value)
 
         for key, value in kwargs.items():
             options.add_experimental_option(key, value)
 
         super().__init__(options=options)
+        self._keep_alive()
 
+        self._caffeine_stop = threading.Event()
+        # retry의 대기를 중단시키는 이벤트 -> abort()
+        self._abort_event = threading.Event()
         if prevent_sleep:
             self._caffeinate()
 
         # selenium의 implicitly_wait와 explicit_wait는 빠르게 동작하지 않음.
         # 따라서, try-except-pass로 구현된 _repeat 메서드를 사용하여 대체함.
         self.implicitly_wait(0)
-        self.context_finder = ContextFinder(self)
         self.timeout = timeout
         self.freq = freq
+        self.cache_ttl = cache_ttl
+        # (find 종류, xpath, ...) -> (저장 시각, 결과)
+        # 창이나 프레임, 페이지가 바뀌면 비움
+        self._find_cache: dict[tuple, tuple[float, Any]] = {}
+
+    @cached_property
+    def context_finder(self) -> ContextFinder:
+        """디버그 모드에서 요소를 찾지 못했을 때 처음 쓰는 시점에 만듦"""
+        return ContextFinder(self)
 
     def __del__(self):
         if self.debug:
             self.quit()
 
+    def quit(self):
+        self._caffeine_stop.set()
+        super().quit()
+
+    def get(self, url: str):
+        self.clear_cache()
+        super().get(url)
+
+    # 페이지가 바뀌는 다른 이동에서도 find 캐시를 비움
+    def back(self):
+        self.clear_cache()
+        super().back()
+
+    def forward(self):
+        self.clear_cache()
+        super().forward()
+
+    def refresh(self):
+        self.clear_cache()
+        super().refresh()
+
+    def set_cache_ttl(self, ttl: float):
+        """find, find_or_none, find_all 결과를 캐시할 시간을 설정합니다.
+
+        Args:
+            ttl (float): 캐시할 시간 (초 단위). -> 0이면 캐시하지 않고 항상 새로 찾음
+
+        캐시는 SwChrome의 이동 메서드(get, back, goto_frame, goto_window 등)에서만
+        비워짐 -> 요소의 send_keys, select, execute_script, switch_to 등으로
+        페이지나 프레임이 바뀌면 clear_cache를 직접 불러야 함.
+
+        Examples:
+            ```python
+            # 같은 요소를 짧은 간격으로 여러 번 찾을 때 캐시 켜기
+            web.set_cache_ttl(0.2)
+            ```
+
+        """
+        self.cache_ttl = ttl
+        self.clear_cache()
+
+    def clear_cache(self):
+        """find, find_or_none, find_all 결과 캐시를 비웁니다.
+        goto_frame, goto_window, get 등에서는 자동으로 비워지므로
+        그 밖의 방법(switch_to, 요소의 send_keys 등)으로 페이지가 바뀐 경우에만
+        호출하면 됨.
+        """
+        self._find_cache.clear()
+
     def no_exc(
         self,
         include: tuple[type[BaseException], ...] = (WebDriverException,),
@@ -181,6 +348,29 @@ class SwChrome(Chrome):
         """
         return RetryConfig(self, timeout, freq)
 
+    def acquire_tab(self, url: str | None = None):
+        """새 탭을 열어 전환하고, with 구문이 끝나면 탭을 닫고 원래 창으로 돌아옵니다.
+        SwChrome을 여러 개 띄우는 대신 하나의 브라우저에서 탭을 나눠 쓰면 메모리를 훨씬 적게 씀.
+        WebDriver는 thread-safe하지 않음 -> 여러 스레드에서 동시에 쓰면 안 됨.
+
+        Args:
+            url (str, optional): 새 탭에서 열 URL. 기본값은 None. -> 빈 탭
+
+        Returns:
+            NewTab: 새 탭 객체. -> with 구문으로 사용
+
+        Examples:
+            ```python
+            with web.acquire_tab("https://www.google.com"):
+                web.find(tag="a").click()
+
+            # 원래 창으로 돌아옴
+            web.find(tag="a")
+            ```
+
+        """
+        return NewTab(self, url)
+
     def find(  # noqa: D417
         self,
         xpath="",
@@ -222,12 +412,23 @@ class SwChrome(Chrome):
             ```
         """
 
-        xpath = xpath or generate_xpath(**locals())
-        if self.debug:
-            print(f"LOG: find: {xpath=}")
+        xpath = xpath or _build_xpath(
+            tag,
+            id,
+            id_contains,
+            class_name,
+            class_name_contains,
+            text,
+            text_contains,
+            kwargs,
+        )
+        _log.debug("LOG: find: xpath=%r", xpath)
         try:
             return SwElement(
-                self.retry(lambda: self.find_element(By.XPATH, xpath)), xpath
+                self._cached(
+                    ("find", xpath), self.retry, self.find_element, By.XPATH, xpath
+                ),
+                xpath,
             )
         except NoSuchElementException:
             if self.debug:
@@ -278,12 +479,29 @@ class SwChrome(Chrome):
             ```
         """
 
-        xpath = xpath or generate_xpath(**locals())
+        xpath = xpath or _build_xpath(
+            tag,
+            id,
+            id_contains,
+            class_name,
+            class_name_contains,
+            text,
+            text_contains,
+            kwargs,
+        )
 
-        try:
-            return SwElement(self.find_element(By.XPATH, xpath), xpath)
-        except NoSuchElementException:
-            return None
+        # find와 같은 캐시를 씀. 못 찾은 경우는 캐시하지 않음
+        # -> 요소가 나타나기를 기다리는 반복문이 늦어지지 않게
+        key = ("find", xpath)
+        element = self._cache_get_element(key)
+        if element is None:
+            # find_elements는 요소가 없으면 예외 대신 빈 리스트를 반환함
+            elements = self.find_elements(By.XPATH, xpath)
+            if not elements:
+                return None
+            element = elements[0]
+            self._cache_put(key, element)
+        return SwElement(element, xpath)
 
     def find_all(  # noqa: D417
         self,
@@ -297,6 +515,7 @@ class SwChrome(Chrome):
         class_name_contains: ExprStr | None = None,
         text: ExprStr | None = None,
         text_contains: ExprStr | None = None,
+        min_count=1,
         **kwargs: ExprStr,
     ):
         """Finds all elements based on the given criteria.
@@ -307,22 +526,41 @@ class SwChrome(Chrome):
             tag (str): The tag name of the element.
             `prop` (ExprStr, optional): The property of the element.(**`class` is renamed to `class_name`**)
             `prop`_contains (ExprStr, optional): The substring of the property.
+            min_count (int): The minimum number of elements to wait for. Defaults to 1.
             **kwargs (ExprStr): Additional criteria.
 
         Returns:
             SwElements: The found elements.
 
         Raises:
-            NoSuchElementException: If no elements are found.
+            NoSuchElementException: If fewer than `min_count` elements are found.
         """
 
-        xpath = xpath or generate_xpath(**locals())
-
-        self.find(xpath)
-        return SwElements(
-            [SwElement(e, xpath) for e in self.find_elements(By.XPATH, xpath)]
+        xpath = xpath or _build_xpath(
+            tag,
+            id,
+            id_contains,
+            class_name,
+            class_name_contains,
+            text,
+            text_contains,
+            kwargs,
         )
 
+        def find_elements():
+            # find로 한 번 기다린 뒤 다시 찾지 않고, find_elements 한 번으로 재시도함
+            try:
+                return self.retry(self._find_elements_at_least, xpath, min_count)
+            except NoSuchElementException:
+                if not self.debug:
+                    msg = f"\n**Element not found**\n{xpath=}\n"
+                    raise NoSuchElementException(msg) from None
+                self.context_finder.search(xpath)
+                return self.find_elements(By.XPATH, xpath)
+
+        elements = self._cached(("find_all", xpath, min_count), find_elements)
+        return SwElements(elements, xpath)
+
     def find_all_or_none(  # noqa: D417
         self,
         xpath="",
@@ -353,12 +591,19 @@ class SwChrome(Chrome):
         SwElements | None: The found elements or None if no elements are found.
         """
 
-        xpath = xpath or generate_xpath(**locals())
-
-        return SwElements(
-            [SwElement(e, xpath) for e in self.find_elements(By.XPATH, xpath)]
+        xpath = xpath or _build_xpath(
+            tag,
+            id,
+            id_contains,
+            class_name,
+            class_name_contains,
+            text,
+            text_contains,
+            kwargs,
         )
 
+        return SwElements(self.find_elements(By.XPATH, xpath), xpath)
+
     def wait(
         self,
         dur: float | str | tuple[str, str] | None = None,
@@ -401,45 +646,43 @@ class SwChrome(Chrome):
 
         """
 
-        if isinstance(dur, str):
-            # convert_date_string 함수로 받은 datetime 값
-            converted_datetime = convert_date_string(dur, korean_year=korean_year)
+        # 숫자만 받은 경우는 변환 없이 바로 대기
+        dur_type = type(dur)
+        if (dur_type is int or dur_type is float) and until is None and not display:
+            if dur:
+                time.sleep(dur)
+            return
 
-            # 현재 날짜와 시간
-            now = datetime.now()
+        # 현재 시각은 한 번만 구해서 모든 파싱에 같이 씀
+        now = datetime.now()
+        today = now.date()
 
-            # 날짜 부분을 제거하고 시간 부분만 추출
-            time_difference = datetime.combine(
-                now.date(), converted_datetime.time()
-            ) - datetime.combine(now.date(), now.time())
+        if isinstance(dur, str):
+            # convert_date_string 함수로 받은 datetime 값
+            converted_datetime = convert_date_string(
+                dur, korean_year=korean_year, today=today
+            )
 
-            # 시간 부분을 초로 변환
-            dur = time_difference.total_seconds()
+            # 날짜 부분은 무시하고 시간 부분끼리의 차이를 초로 계산
+            dur = _seconds_of_day(converted_datetime) - _seconds_of_day(now)
         elif isinstance(dur, tuple):
-            dur = abs(
-                (
-                    convert_date_string(dur[1], korean_year=korean_year)
-                    - convert_date_string(dur[0], korean_year=korean_year)
-                ).total_seconds()
+            start, end = (
+                convert_date_string(text, korean_year=korean_year, today=today)
+                for text in dur
             )
+            dur = abs((end - start).total_seconds())
 
         if until:
             dur = (
-                convert_date_string(until, korean_year=korean_year) - datetime.now()
+                convert_date_string(until, korean_year=korean_year, today=today) - now
             ).total_seconds()
 
         if display:
-            print("Waiting for", dur, "seconds")
-
-            def print_remaining_time(remaining_time):
-                while remaining_time > 0:
-                    print(f"\t{remaining_time} seconds left", end="\r")
-                    time.sleep(1)
-                    remaining_time -= 1
-
-            threading.Thread(
-                target=print_remaining_time, args=[dur], daemon=True
-            ).start()
+            eta = datetime.now() + timedelta(seconds=dur or 0)
+            print(f"Waiting for {dur} seconds (until {eta:%H:%M:%S})")
+            if dur and dur > 0:
+                self._sleep_with_countdown(dur)
+            return
 
         if dur:
             time.sleep(dur)
@@ -477,12 +720,16 @@ class SwChrome(Chrome):
         """
         keyboard.remove_hotkey(key)
 
-    def wait_hotkey(self, key: str):
+    def wait_hotkey(self, key: str, timeout: float | None = None):
         """특정 키보드 입력을 대기합니다. -> keyboard 모듈 사용
 
         Args:
             key (str): 키보드의 키를 나타내는 문자열.
                 - "ctrl+shift+a", "f1", "esc"
+            timeout (float, optional): 최대 대기 시간 (초 단위). 기본값은 None. -> 무한정 대기
+
+        Returns:
+            bool: 키가 눌렸으면 True, timeout이 지나면 False.
 
         Examples:
             ```python
@@ -498,16 +745,47 @@ class SwChrome(Chrome):
             ```
 
         """
-        keyboard.wait(key)
+        # 핫키 콜백에서 Event를 set하고, 대기는 Event.wait()로 함
+        pressed = threading.Event()
+        hotkey = keyboard.add_hotkey(key, pressed.set)
+        try:
+            return pressed.wait(timeout)
+        finally:
+            keyboard.remove_hotkey(hotkey)
+
+    def abort(self):
+        """진행 중인 retry 대기를 중단합니다.
+        다른 스레드나 핫키 콜백에서 호출하면, 요소를 기다리던 find 등이 바로 에러를 반환함.
+
+        Examples:
+            ```python
+            # ctrl+c로 요소 기다리기를 중단
+            web.add_hotkey("ctrl+c", web.abort)
+            ```
+
+        """
+        self._abort_event.set()
 
     def close_all(self):
-        """모든 창을 닫습니다."""
-        for window_handle in self.window_handles:
+        """모든 창을 닫습니다.
+
+        마지막 창을 제외한 창들은 CDP로 바로 닫아서 창마다 switch_to.window를 하지 않음.
+        마지막 창은 드라이버 상태를 맞추기 위해 전환 후 close()로 닫음.
+        """
+        self.clear_cache()
+        window_handles = self.window_handles
+        for window_handle in window_handles[:-1]:
             try:
-                self.switch_to.window(window_handle)
-                self.close()
-            except NoSuchWindowException:
-                pass
+                # 크롬의 window handle은 CDP target id와 같음
+                self.execute_cdp_cmd(
+                    "Target.closeTarget",
+                    {"targetId": window_handle.removeprefix("CDwindow-")},
+                )
+            except WebDriverException:
+                self._close_window(window_handle)
+
+        for window_handle in window_handles[-1:]:
+            self._close_window(window_handle)
 
     def goto_frame(self, path="/"):
         """주어진 경로를 따라 프레임으로 전환합니다.
@@ -536,24 +814,20 @@ class SwChrome(Chrome):
 
         """
 
-        split_path = path.split("/")
-
-        if split_path[0] == "":
+        self.clear_cache()
+        if path == "/":  # 가장 흔한 호출 -> 경로 해석 없이 바로 최상위 문서로 이동
             self.switch_to.default_content()
-            split_path = split_path[1:]
-
-        elif split_path[0] == ".":
-            split_path = split_path[1:]
+            return
 
-        for node in split_path:
-            if node == "":
-                continue
-            if node == "..":
+        for op, node in _compile_frame_path(path):
+            if op == "root":
+                self.switch_to.default_content()
+            elif op == "parent":
                 self.switch_to.parent_frame()
-            elif node.isdigit():
-                self.switch_to.frame(int(node))
+            elif op == "index":
+                self.switch_to.frame(node)
             else:
-                self.retry(lambda node=node: self.switch_to.frame(node))
+                self.retry(self.switch_to.frame, node)
 
     def goto_window(self, i=0):
         """주어진 인덱스의 윈도우로 전환합니다.
@@ -573,6 +847,7 @@ class SwChrome(Chrome):
 
         """
 
+        self.clear_cache()
         self.retry(lambda: self.switch_to.window(self.window_handles[i]))
 
     def goto_alert(self):
@@ -605,19 +880,155 @@ class SwChrome(Chrome):
     #     """
     #     return self.retry(lambda: SwElement(self.switch_to.active_element))
 
-    def retry(self, func: Callable):
-        """func을 실행하고, 예외가 발생하면 timeout 시간 동안 freq 간격으로 재시도합니다.
+    def retry(self, func: Callable, *args):
+        """func(*args)를 실행하고, 예외가 발생하면 timeout 시간 동안 재시도합니다.
+        abort()가 호출되면 기다리지 않고 한 번 더 시도한 뒤 실패하면 에러를 반환.
+        재시도 간격은 0.02초에서 시작해서 1.3배씩 늘어나고, 최대 freq까지 늘어납니다.
+        -> 금방 나타나는 요소는 빨리 찾고, 늦게 나타나는 요소는 요청을 덜 보냄.
+        간격에는 최대 20%의 jitter를 더해서 여러 프로세스가 같은 박자로 요청하지 않게 함.
 
         실패시 마지막 시도의 에러를 반환.
         """
-        end_time = time.time() + self.timeout
-        while time.time() < end_time:
+        # 반복문 안에서 속성을 찾지 않도록 지역 변수로 가져옴
+        monotonic, abort, jitter = time.monotonic, self._abort_event, random.random
+        abort.clear()
+        freq = self.freq
+        # 다음 시도 시각을 절대 시각으로 잡아서, 시도하는 데 걸린 시간만큼 밀리지 않게 함
+        next_attempt = monotonic()
+        deadline = next_attempt + self.timeout
+        delay = min(_RETRY_MIN_DELAY, freq)
+        while True:
             try:
-                return func()
-            except WebDriverException:
-                pass
-            time.sleep(self.freq)
+                return func(*args)
+            except WebDriverException as e:
+                if isinstance(e, StaleElementReferenceException):
+                    # 캐시된 요소가 사라졌을 수 있음
+                    self.clear_cache()
+                # 현재 시각은 실패했을 때 한 번만 구함
+                now = monotonic()
+                if now >= deadline or abort.is_set():
+                    raise
+
+            next_attempt = min(
+                next_attempt + delay * (1 + _RETRY_JITTER * jitter()), deadline
+            )
+            # abort()가 호출되면 바로 깨어나서 마지막으로 한 번 더 시도함
+            if next_attempt > now:
+                abort.wait(next_attempt - now)
+            delay = min(delay * _RETRY_BACKOFF, freq)
+
+    def _cached(self, key: tuple, func: Callable, *args):
+        """cache_ttl 안에 같은 key로 찾은 결과가 있으면 재사용하고, 없으면 func을 실행합니다."""
+        if self.cache_ttl <= 0:
+            return func(*args)
+
+        hit = self._cache_get(key)
+        if hit is not None:
+            return hit
+
+        result = func(*args)
+        self._cache_put(key, result)
+        return result
+
+    def _cache_get(self, key: tuple):
+        """cache_ttl 안에 저장된 결과를 반환하고, 없으면 None을 반환합니다."""
+        hit = self._find_cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < self.cache_ttl:
+            return hit[1]
+        return None
+
+    def _cache_get_element(self, key: tuple):
+        """캐시된 요소를 반환합니다.
+        요소가 DOM에서 사라졌으면 캐시에서 지우고 None을 반환함. -> 다시 찾게 됨
+        """
+        element = self._cache_get(key)
+        if element is None:
+            return None
+        try:
+            element.is_enabled()
+        except StaleElementReferenceException:
+            self._find_cache.pop(key, None)
+            return None
+        return element
+
+    def _cache_put(self, key: tuple, result):
+        if self.cache_ttl <= 0:
+            return
+        if len(self._find_cache) >= _FIND_CACHE_SIZE:
+            self._find_cache.clear()
+        self._find_cache[key] = (time.monotonic(), result)
+
+    def _find_elements_at_least(self, xpath: str, min_count: int):
+        """요소가 min_count개 이상이면 반환하고, 아니면 NoSuchElementException을 발생시킵니다."""
+        elements = self.find_elements(By.XPATH, xpath)
+        if len(elements) < min_count:
+            msg = f"Found {len(elements)} of {min_count} elements: {xpath}"
+            raise NoSuchElementException(msg)
+        return elements
+
+    def _goto_window_handle(self, window_handle: str):
+        # window_handles를 다시 받아오지 않고 이미 알고 있는 handle로 바로 전환
+        self.clear_cache()
+        self.retry(self.switch_to.window, window_handle)
+
+    def _close_window(self, window_handle: str):
+        try:
+            self.switch_to.window(window_handle)
+            self.close()
+        except NoSuchWindowException:
+            pass
+
+    def _sleep_with_countdown(self, dur: float):
+        """남은 시간을 같은 줄에 갱신하며 대기합니다.
+        스레드를 따로 띄우지 않고, 대기 시간과 관계없이 최대 100번 정도만 출력함.
+        """
+        interval = max(1.0, dur / 100)
+        deadline = time.monotonic() + dur
+        while (remaining := deadline - time.monotonic()) > 0:
+            print(f"\t{math.ceil(remaining)} seconds left ", end="\r", flush=True)
+            time.sleep(min(interval, remaining))
+        print()
+
+    def _keep_alive(self):
+        """chromedriver와의 HTTP 연결을 요청마다 새로 만들지 않고 재사용하도록 합니다.
+
+        selenium 4는 기본으로 keep-alive지만, 꺼져 있으면 매 요청마다 연결을 새로 맺음.
+        retry처럼 짧은 간격으로 여러 번 요청하는 경우에 비용이 큼.
+        연결 풀은 quit()에서만 정리되므로 close_all()로 창을 닫아도 유지됨.
+        """
+        executor = self.command_executor
+        config = getattr(executor, "_client_config", None)
+        if config is not None:
+            rebuild = not config.keep_alive
+            config.keep_alive = True
+        else:
+            # client_config가 없는 이전 버전의 selenium
+            rebuild = not getattr(executor, "keep_alive", True)
+            executor.keep_alive = True
+
+        if rebuild:
+            executor._conn = executor._get_connection_manager()
+
+        # urllib3의 기본 풀은 연결을 하나만 보관하므로, 다른 스레드(_caffeinate 등)가
+        # 동시에 요청하면 연결을 새로 맺고 버림 -> 보관할 연결 수를 늘림
+        conn = getattr(executor, "_conn", None)
+        if isinstance(conn, urllib3.PoolManager):
+            conn.connection_pool_kw["maxsize"] = _HTTP_POOL_SIZE
+            conn.clear()  # 이미 만들어진 풀은 다음 요청에서 새 설정으로 다시 만듦
+
+    def _caffeinate(self):
+        """30초마다 마우스 이동 이벤트를 보내서 대기 모드에 빠지지 않도록 합니다.
+        ActionChains 대신 CDP 명령 하나만 보냄. quit()하면 멈춤.
+        """
+
+        # 매번 새로 만들지 않도록 이벤트 인자는 한 번만 만듦
+        mouse_moved = {"type": "mouseMoved", "x": 1, "y": 1}
 
-        return func()
+        def move_mouse():
+            while not self._caffeine_stop.wait(30):
+                try:
+                    self.execute_cdp_cmd("Input.dispatchMouseEvent", mouse_moved)
+                except WebDriverException:
+                    pass
 
-    def _caffeinate(self): ...
+        threading.Thread(target=move_mouse, daemon=True).start()
@@ -9,6 +9,7 @@ Classes:
 
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -16,10 +17,55 @@ if TYPE_CHECKING:
 
 from selenium.common.exceptions import NoSuchElementException
 
+_log = logging.getLogger(__name__)
+
 window_index = int
 frame_path = str
 context = tuple[window_index, frame_path]
 
+# 프레임을 전환하지 않고, 현재 문서에서 같은 출처의 iframe들을 재귀로 훑음
+# [xpath에 해당하는 요소가 있는 프레임들, 접근할 수 없는 (cross-origin 등) 프레임들]을
+# 현재 문서 기준 name / id / index 목록으로 반환
+_FRAME_WALK_SCRIPT = """
+const xpath = arguments[0];
+const found = [];
+const blocked = [];
+const walk = (doc, path) => {
+    let hit = false;
+    try {
+        hit = doc.evaluate(
+            xpath, doc, null, XPathResult.BOOLEAN_TYPE, null
+        ).booleanValue;
+    } catch (e) {}
+    if (hit) {
+        found.push(path);
+    }
+    doc.querySelectorAll("iframe").forEach((frame, i) => {
+        const header =
+            frame.getAttribute("name") || frame.getAttribute("id") || String(i);
+        let child = null;
+        try {
+            child = frame.contentDocument;
+        } catch (e) {}
+        if (child) {
+            walk(child, [...path, header]);
+        } else {
+            blocked.push([...path, header]);
+        }
+    });
+};
+walk(document, []);
+return [found, blocked];
+"""
+
+
+def _log_frame(window_index: int, frame_list: list[str]):
+    # 로그가 꺼져 있으면 경로 문자열도 만들지 않음
+    if _log.isEnabledFor(logging.DEBUG):
+        _log.debug(
+            "window_index: %s, frame_path: %s", window_index, "/".join(frame_list)
+        )
+
 
 class ContextFinder:
     """ContextFinder class helps in finding the context (window and frame) of an element
@@ -29,6 +75,9 @@ class ContextFinder:
     Attributes:
         driver (SwChrome): The SwChrome driver instance.
         contexts (list[context]): A list of contexts where the element was found.
+        window_handles (list[str]): The window handles captured when the search started.
+        found_contexts (dict[tuple, list[context]]): Contexts found by earlier searches,
+            keyed by the xpath, window handles and URL of the current window.
     """
 
     def __init__(self, driver: SwChrome):
@@ -39,6 +88,8 @@ class ContextFinder:
         """
         self.driver = driver
         self.contexts: list[context] = []
+        self.window_handles: list[str] = []
+        self.found_contexts: dict[tuple, list[context]] = {}
 
     def search(self, xpath: str):
         """Searches for the element specified by the given XPath across different contexts
@@ -52,12 +103,23 @@ class ContextFinder:
             NoSuchElementException: If the element is not found in any context.
         """
         self.xpath = xpath
-        self.current_window_index = self.driver.window_handles.index(
+        self.contexts = []
+        # 창 목록은 한 번만 받아와서 검색하는 동안 계속 씀
+        self.window_handles = list(self.driver.window_handles)
+        self.current_window_index = self.window_handles.index(
             self.driver.current_window_handle
         )
-        self._search_all_contexts()
-        self.driver.goto_window(self.current_window_index)
-        self.driver.goto_frame("/")
+        # 같은 페이지에서 같은 xpath를 다시 찾는 경우에는 전체 탐색을 건너뜀
+        # (찾은 경우만 저장함. 창 목록이나 현재 창의 URL이 바뀌면 다시 탐색함)
+        key = (xpath, tuple(self.window_handles), self.driver.current_url)
+        if key in self.found_contexts:
+            self.contexts = list(self.found_contexts[key])
+        else:
+            self._search_all_contexts()
+            if self.contexts:
+                self.found_contexts[key] = list(self.contexts)
+        # 창을 전환하면 최상위 프레임으로 돌아가므로 goto_frame("/")은 필요 없음
+        self.driver._goto_window_handle(self.window_handles[self.current_window_index])
 
         if not self.contexts:
             msg = f"Element not found: {xpath}"
@@ -78,7 +140,7 @@ class ContextFinder:
         user_input = int(user_input)
         window_index, frame_path = self.contexts[user_input - 1]
         if window_index != self.current_window_index:
-            self.driver.goto_window(window_index)
+            self.driver._goto_window_handle(self.window_handles[window_index])
             print(f"self.driver.goto_window({window_index})")
 
         self.driver.goto_frame(frame_path)
@@ -87,55 +149,42 @@ class ContextFinder:
     def _search_all_contexts(self):
         """Internal method to search for the element across all windows and frames."""
         with self.driver.no_exc(), self.driver.set_retry(1, 0.1):
-            indices = list(range(len(self.driver.window_handles)))
+            indices = list(range(len(self.window_handles)))
             indices = (
                 indices[self.current_window_index :]
                 + indices[: self.current_window_index]
             )
-            print(f"{indices=}")
+            _log.debug("indices=%s", indices)
 
             for window_index in indices:
-                self.driver.goto_window(window_index)
-                self.driver.goto_frame("/")
+                # 창을 전환하면 최상위 프레임에서 시작함
+                self.driver._goto_window_handle(self.window_handles[window_index])
                 frame_list: list[str] = [""]  # "/".join 해야해서 빈 문자열 추가
                 self._depth_first_search(window_index, frame_list)
 
     def _depth_first_search(self, window_index, frame_list):
         """Internal method to perform a depth-first search (DFS) for the element
         within the given window and frame list.
+        Same-origin frames are searched by the script without switching, so only
+        the frames the script cannot access are switched into.
 
         Args:
             window_index (int): The index of the current window.
             frame_list (list[str]): The list of frames to search within.
         """
-        print(f"window_index: {window_index}, frame_path: { '/'.join(frame_list) }")
-        # find element
-        try:
-            self.driver.find(self.xpath)
-            self.contexts.append((window_index, "/".join(frame_list)))
-        except NoSuchElementException:
-            print("\t-> The element not found")
-
-        # find iframe
-        try:
-            frames = self.driver.find_all(tag="iframe")
-            frame_headers = []
-
-            for idx, frame in enumerate(frames):
-                frame_header = (
-                    frame.get_attribute("name") or frame.get_attribute("id") or str(idx)
-                )
-                frame_headers.append(frame_header)
-        except NoSuchElementException:
-            print("\t-> No child frame")
-            return
-
-        for frame_header in frame_headers:
-            self.driver.goto_frame(frame_header)
-            frame_list.append(frame_header)
+        _log_frame(window_index, frame_list)
+        found, blocked = self.driver.execute_script(_FRAME_WALK_SCRIPT, self.xpath)
+        for path in found:
+            self.contexts.append((window_index, "/".join([*frame_list, *path])))
+        if not found:
+            _log.debug("\t-> The element not found")
+
+        for path in blocked:
+            self.driver.goto_frame("/".join(path))
+            frame_list.extend(path)
             self._depth_first_search(window_index, frame_list)
-            self.driver.goto_frame("..")
-            frame_list.pop()
+            self.driver.goto_frame("/".join([".."] * len(path)))
+            del frame_list[-len(path) :]
 
     def _format_contexts(self):
         """Internal method to generate a string representation of the found contexts.
@@ -161,8 +210,10 @@ class ContextFinder:
         Returns:
             str: The user's input.
         """
-        user_input = input(message)
-        valid_inputs = [str(i) for i in range(1, len(self.contexts) + 1)] + ["n"]
-        while user_input.lower() not in valid_inputs:
-            user_input = input(message)
-        return user_input.lower()
+        while True:
+            user_input = input(message).strip().lower()
+            if user_input == "n":
+                return user_input
+            # 목록을 만들지 않고 범위만 확인함
+            if user_input.isdecimal() and 1 <= int(user_input) <= len(self.contexts):
+                return user_input
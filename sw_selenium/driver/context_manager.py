@@ -5,6 +5,7 @@ This module provides context managers for handling exceptions and retry configur
 Classes:
     NoException: A context manager to suppress specified exceptions.
     RetryConfig: A context manager to modify retry configurations.
+    NewTab: A context manager to work in a temporary browser tab.
 """
 
 from __future__ import annotations
@@ -25,6 +26,8 @@ class NoException:
         exclude_exceptions (tuple[type[BaseException], ...] | None): Exceptions to exclude from suppression.
     """
 
+    __slots__ = ("driver", "debug", "include_exceptions", "exclude_exceptions")
+
     def __init__(
         self,
         driver: SwChrome,
@@ -63,18 +66,18 @@ class NoException:
         if self.debug:
             self.driver.debug = True
 
-        if exc_type is None:
-            return False
-
-        if self.include_exceptions and not issubclass(
-            exc_type, self.include_exceptions
-        ):
-            return False
-
-        if self.exclude_exceptions and issubclass(exc_type, self.exclude_exceptions):  # noqa: SIM103
-            return False
-
-        return True
+        # Short-circuits: issubclass only runs for the filters that were given.
+        return (
+            exc_type is not None
+            and (
+                not self.include_exceptions
+                or issubclass(exc_type, self.include_exceptions)
+            )
+            and not (
+                self.exclude_exceptions
+                and issubclass(exc_type, self.exclude_exceptions)
+            )
+        )
 
 
 class RetryConfig:
@@ -88,6 +91,14 @@ class RetryConfig:
         retry_frequency (float): The new frequency value.
     """
 
+    __slots__ = (
+        "driver",
+        "orig_timeout",
+        "orig_freq",
+        "retry_timeout",
+        "retry_frequency",
+    )
+
     def __init__(
         self,
         driver: SwChrome,
@@ -127,3 +138,64 @@ class RetryConfig:
         self.driver.timeout = self.orig_timeout
         self.driver.freq = self.orig_freq
         return False
+
+
+class NewTab:
+    """Context manager to work in a temporary browser tab.
+
+    Opens a new tab in the same browser, switches to it, and on exit closes it and
+    switches back to the previous window. The driver is not thread-safe, so the
+    tab must be used from the thread that owns the driver.
+
+    Attributes:
+        driver (SwChrome): The SwChrome driver instance.
+        url (str | None): The URL to open in the new tab.
+        prev_handle (str | None): The window handle to return to on exit.
+        handle (str | None): The window handle of the new tab.
+    """
+
+    __slots__ = ("driver", "url", "prev_handle", "handle")
+
+    def __init__(self, driver: SwChrome, url: str | None = None):
+        """Initializes the NewTab context manager.
+
+        Args:
+            driver (SwChrome): The SwChrome driver instance.
+            url (str | None): The URL to open in the new tab.
+        """
+        self.driver = driver
+        self.url = url
+        self.prev_handle: str | None = None
+        self.handle: str | None = None
+
+    def __enter__(self):
+        """Enters the context manager, opening and switching to a new tab.
+
+        Returns:
+            SwChrome: The driver, now focused on the new tab.
+        """
+        self.driver.clear_cache()
+        self.prev_handle = self.driver.current_window_handle
+        self.driver.switch_to.new_window("tab")
+        self.handle = self.driver.current_window_handle
+        if self.url:
+            self.driver.get(self.url)
+        return self.driver
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Exits the context manager, closing the tab and restoring the previous window.
+
+        Args:
+            exc_type (Type[BaseException]): The exception type.
+            exc_val (BaseException): The exception instance.
+            exc_tb (TracebackType): The traceback object.
+
+        Returns:
+            bool: False to indicate that exceptions should not be suppressed.
+        """
+        self.driver.clear_cache()
+        # with 안에서 다른 창으로 전환했을 수 있으므로 새 탭으로 돌아가서 닫음
+        self.driver.switch_to.window(self.handle)
+        self.driver.close()
+        self.driver.switch_to.window(self.prev_handle)
+        return False
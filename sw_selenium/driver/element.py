@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Literal
 
 from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.action_chains import ActionChains
@@ -9,15 +10,39 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.select import Select
 
-from sw_selenium.parsing import generate_xpath
+from sw_selenium.parsing.xpath_parser import _build_xpath
 
-from .elements import SwElements
+from .elements import (
+    _DOWN_XPATH,
+    _LEFT_XPATH,
+    _RIGHT_XPATH,
+    _UP_XPATH,
+    SwElements,
+)
 
 if TYPE_CHECKING:
     from sw_selenium.parsing.xpath_parser import AxisStr, ExprStr
 
     from .chrome import SwChrome
 
+_log = logging.getLogger(__name__)
+
+# click(by=...) -> 실행할 동작
+_CLICK_ACTIONS: dict[str, Callable[[SwElement], Any]] = {
+    "enter": lambda element: element.send_keys(Keys.ENTER),
+    "js": lambda element: element.driver.execute_script(
+        "arguments[0].click();", element
+    ),
+    "mouse": lambda element: ActionChains(element._parent).click(element).perform(),
+}
+
+# select(by=...) -> 실행할 동작
+_SELECT_ACTIONS: dict[str, Callable[[Select, str | int], None]] = {
+    "index": lambda select, value: select.select_by_index(int(value)),
+    "value": lambda select, value: select.select_by_value(str(value)),
+    "text": lambda select, value: select.select_by_visible_text(str(value)),
+}
+
 
 class SwElement(WebElement):
     """SwElement"""
@@ -29,19 +54,19 @@ class SwElement(WebElement):
 
     @property
     def up(self):
-        return self.find("..")
+        return self.find(_UP_XPATH)
 
     @property
     def down(self):
-        return self.find_all_or_none("./*")
+        return self.find_all_or_none(_DOWN_XPATH)
 
     @property
     def left(self):
-        return self.find_all_or_none(axis="preceding-sibling")
+        return self.find_all_or_none(_LEFT_XPATH)
 
     @property
     def right(self):
-        return self.find_all_or_none(axis="following-sibling")
+        return self.find_all_or_none(_RIGHT_XPATH)
 
     def move_mouse(self, offset_x=0, offset_y=0):
         ActionChains(self._parent).move_to_element_with_offset(
@@ -54,27 +79,16 @@ class SwElement(WebElement):
         에러가 안나는 방향의 클릭들을 지원함.
         경험적으로 send_keys(Keys.ENTER)가 가장 안전함.
         """
-        if by == "enter":
-            func = lambda: self.send_keys(Keys.ENTER)
-        elif by == "js":
-            func = lambda: self.driver.execute_script("arguments[0].click();", self)
-        elif by == "mouse":
-            func = lambda: ActionChains(self._parent).click(self).perform()
-
-        self.driver.retry(func)
+        # 클릭으로 페이지가 바뀔 수 있으므로 find 캐시를 비움
+        self.driver.clear_cache()
+        self.driver.retry(_CLICK_ACTIONS[by], self)
 
     def select(
         self,
         by: Literal["index", "value", "text"] = "index",
         value: str | int = 0,
     ):
-        select = Select(self)
-        if by == "index":
-            select.select_by_index(int(value))
-        elif by == "value":
-            select.select_by_value(str(value))
-        elif by == "text":
-            select.select_by_visible_text(str(value))
+        _SELECT_ACTIONS[by](Select(self), value)
 
     def find(  # noqa: D417
         self,
@@ -119,13 +133,22 @@ class SwElement(WebElement):
             ```
         """
 
-        xpath = xpath or generate_xpath(**locals())
+        xpath = xpath or _build_xpath(
+            tag,
+            id,
+            id_contains,
+            class_name,
+            class_name_contains,
+            text,
+            text_contains,
+            kwargs,
+            axis,
+        )
         full_xpath = f"{self.xpath}/{xpath}"
-        if self.driver.debug:
-            print(f"LOG: find: {xpath=}")
+        _log.debug("LOG: find: xpath=%r", xpath)
         try:
             return SwElement(
-                self.driver.retry(lambda: self.find_element(By.XPATH, xpath)),
+                self.driver.retry(self.find_element, By.XPATH, xpath),
                 full_xpath,
             )
         except NoSuchElementException:
@@ -179,13 +202,30 @@ class SwElement(WebElement):
             ```
         """
 
-        xpath = xpath or generate_xpath(**locals())
+        xpath = xpath or _build_xpath(
+            tag,
+            id,
+            id_contains,
+            class_name,
+            class_name_contains,
+            text,
+            text_contains,
+            kwargs,
+            axis,
+        )
         full_xpath = f"{self.xpath}/{xpath}"
 
-        try:
-            return SwElement(self.find_element(By.XPATH, xpath), full_xpath)
-        except NoSuchElementException:
-            return None
+        # 부모 요소마다 따로 캐시함. 못 찾은 경우는 캐시하지 않음
+        key = ("find", self.id, xpath)
+        element = self.driver._cache_get_element(key)
+        if element is None:
+            # find_elements는 요소가 없으면 예외 대신 빈 리스트를 반환함
+            elements = self.find_elements(By.XPATH, xpath)
+            if not elements:
+                return None
+            element = elements[0]
+            self.driver._cache_put(key, element)
+        return SwElement(element, full_xpath)
 
     def find_all(  # noqa: D417
         self,
@@ -220,12 +260,35 @@ class SwElement(WebElement):
             NoSuchElementException: If no elements are found.
         """
 
-        xpath = xpath or generate_xpath(**locals())
-        full_xpath = f"{self.xpath}/{xpath}"
-        self.find(xpath)
-        return SwElements(
-            [SwElement(e, full_xpath) for e in self.find_elements(By.XPATH, xpath)]
+        xpath = xpath or _build_xpath(
+            tag,
+            id,
+            id_contains,
+            class_name,
+            class_name_contains,
+            text,
+            text_contains,
+            kwargs,
+            axis,
         )
+        full_xpath = f"{self.xpath}/{xpath}"
+
+        def find_elements():
+            # find로 한 번 기다린 뒤 다시 찾지 않고, find_elements 한 번으로 재시도함
+            elements = self.find_elements(By.XPATH, xpath)
+            if not elements:
+                raise NoSuchElementException(full_xpath)
+            return elements
+
+        try:
+            elements = self.driver.retry(find_elements)
+        except NoSuchElementException:
+            if not self.driver.debug:
+                msg = f"\n**Element not found**\n{full_xpath=}\n"
+                raise NoSuchElementException(msg) from None
+            self.driver.context_finder.search(full_xpath)
+            elements = self.driver.find_elements(By.XPATH, full_xpath)
+        return SwElements(elements, full_xpath)
 
     def find_all_or_none(  # noqa: D417
         self,
@@ -259,8 +322,16 @@ class SwElement(WebElement):
         SwElements | None: The found elements or None if no elements are found.
         """
 
-        xpath = xpath or generate_xpath(**locals())
-        full_xpath = f"{self.xpath}/{xpath}"
-        return SwElements(
-            [SwElement(e, full_xpath) for e in self.find_elements(By.XPATH, xpath)]
+        xpath = xpath or _build_xpath(
+            tag,
+            id,
+            id_contains,
+            class_name,
+            class_name_contains,
+            text,
+            text_contains,
+            kwargs,
+            axis,
         )
+        full_xpath = f"{self.xpath}/{xpath}"
+        return SwElements(self.find_elements(By.XPATH, xpath), full_xpath)
@@ -1,59 +1,191 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal
+import re
+from functools import cache
+from typing import TYPE_CHECKING, Any, Callable, Literal
 
-from sw_selenium.parsing import generate_xpath
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote import webelement as _webelement
+
+from sw_selenium.parsing.xpath_parser import _build_xpath
 
 if TYPE_CHECKING:
+    from selenium.webdriver.remote.webelement import WebElement
+
     from sw_selenium.parsing.xpath_parser import AxisStr, ExprStr
 
+    from .chrome import SwChrome
     from .element import SwElement
 
+# up / down / left / right에서 쓰는 xpath -> 매번 generate하지 않도록 미리 만들어 둠
+_UP_XPATH = ".."
+_DOWN_XPATH = "./*"
+_LEFT_XPATH = "preceding-sibling::*"
+_RIGHT_XPATH = "following-sibling::*"
+
+# selenium의 Keys는 유니코드 사용자 정의 영역(U+E000~)의 문자를 씀
+_SPECIAL_KEY_PATTERN = re.compile("[\ue000-\uf8ff]")
+
+# send_keys(by="js") -> 텍스트 input / textarea에 값을 이어 붙이고 이벤트를 발생시킴
+# -> 처리하지 못한 요소의 index 목록을 반환
+_SEND_KEYS_SCRIPT = """
+const [elements, texts] = arguments;
+const textTypes = ["text", "search", "email", "password", "tel", "url"];
+const skipped = [];
+elements.forEach((element, i) => {
+    const editable =
+        element.tagName === "TEXTAREA" ||
+        (element.tagName === "INPUT" && textTypes.includes(element.type));
+    if (!editable || element.disabled || element.readOnly) {
+        skipped.push(i);
+        return;
+    }
+    element.focus();
+    // React 등에서도 값 변경을 감지하도록 prototype의 setter로 값을 넣음
+    const { set } = Object.getOwnPropertyDescriptor(
+        Object.getPrototypeOf(element), "value"
+    );
+    set.call(element, element.value + texts[i]);
+    element.dispatchEvent(new Event("input", { bubbles: true }));
+    element.dispatchEvent(new Event("change", { bubbles: true }));
+});
+return skipped;
+"""
+
+# element.text처럼 화면에 보이는 텍스트만 가져옴 (렌더링되지 않은 요소는 빈 문자열)
+# SVG, MathML 요소에는 innerText가 없으므로 textContent를 씀
+_TEXT_SCRIPT = """
+return arguments[0].map((element) =>
+    element.getClientRects().length
+        ? (element.innerText ?? element.textContent ?? "").trim()
+        : ""
+);
+"""
+
+# 요소마다 그 요소를 기준으로 xpath를 평가해서 index번째 요소를 반환 (없으면 null)
+# -> index가 음수면 뒤에서부터 셈
+# xpath는 createExpression으로 한 번만 컴파일해서 모든 요소에 재사용하고,
+# 첫 번째 요소만 필요하면 전체 목록을 만들지 않음
+_FIND_NTH_EACH_SCRIPT = """
+const [elements, xpath, index] = arguments;
+const expression = document.createExpression(xpath, null);
+const node = (element) => {
+    if (index === 0) {
+        return expression.evaluate(
+            element, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+    }
+    const nodes = expression.evaluate(
+        element, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    return nodes.snapshotItem(index < 0 ? nodes.snapshotLength + index : index);
+};
+return elements.map((element) => {
+    const found = node(element);
+    return found && found.nodeType === Node.ELEMENT_NODE ? found : null;
+});
+"""
+
+
+@cache
+def _get_attribute_script() -> str:
+    """WebElement.get_attribute가 쓰는 selenium의 getAttribute 스크립트를
+    요소 목록에 한 번에 적용하는 스크립트. -> 결과가 get_attribute와 똑같음
+    """
+    if _webelement.getAttribute_js is None:
+        _webelement._load_js()
+    return (
+        "const [elements, name] = arguments;"
+        f"const getAttribute = ({_webelement.getAttribute_js});"
+        "return elements.map((element) => getAttribute(element, name));"
+    )
+
+
+def _click_all_enter(driver: SwChrome, elements: list[SwElement]):
+    for element in elements:
+        driver.retry(element.send_keys, Keys.ENTER)
+
+
+def _click_all_js(driver: SwChrome, elements: list[SwElement]):
+    driver.retry(
+        driver.execute_script,
+        "arguments[0].forEach((element) => element.click());",
+        elements,
+    )
+
+
+def _click_all_mouse(driver: SwChrome, elements: list[SwElement]):
+    # perform()은 실패해도 쌓인 동작을 비움 -> 재시도마다 체인을 새로 만들어야 함
+    # 요소마다 따로 재시도 -> 이미 클릭한 요소를 다시 클릭하지 않음
+    for element in elements:
+        driver.retry(_mouse_click, driver, element)
+
+
+def _mouse_click(driver: SwChrome, element: SwElement):
+    ActionChains(driver).click(element).perform()
+
+
+# click(by=...) -> 요소 전체에 실행할 동작 (by는 click 한 번에 한 번만 확인함)
+_CLICK_ALL_ACTIONS: dict[str, Callable[[SwChrome, list[SwElement]], Any]] = {
+    "enter": _click_all_enter,
+    "js": _click_all_js,
+    "mouse": _click_all_mouse,
+}
+
 
 class SwElements:
-    def __init__(self, elements: list[SwElement]):
-        self._elements = elements
-        self._index = 0
+    __slots__ = ("_items", "_xpath")
+
+    def __init__(
+        self, elements: list[SwElement] | list[WebElement], xpath: str | None = None
+    ):
+        # xpath를 같이 넘기면 WebElement 리스트로 받고, 꺼낼 때 SwElement로 감쌈
+        # -> find_all 결과에서 일부만 쓰는 경우 나머지는 감싸지 않음
+        self._items: list = list(elements) if xpath is not None else elements
+        self._xpath = xpath
 
     def __getitem__(self, index: int):
-        return self._elements[index]
+        if isinstance(index, slice):
+            return self._elements[index]
+        return self._get(index)
 
     def __iter__(self):
-        self._index = 0
-        return self
-
-    def __next__(self):
-        if self._index < len(self._elements):
-            result = self._elements[self._index]
-            self._index += 1
-            return result
-
-        raise StopIteration
+        # 반복마다 새 iterator를 반환 -> 중첩 반복도 가능
+        if self._xpath is None:
+            return iter(self._items)
+        return (self._get(index) for index in range(len(self._items)))
 
     def __bool__(self):
-        return bool(self._elements)
+        return bool(self._items)
 
     def __len__(self):
-        return len(self._elements)
+        return len(self._items)
 
     @property
     def text(self):
-        """text들 모두 반환 -> text가 없으면 빈 문자열 반환"""
-        return [element.text for element in self._elements]
+        """text들 모두 반환 -> text가 없으면 빈 문자열 반환
+        요소마다 요청하지 않고 execute_script 한 번으로 가져옴.
+        """
+        elements = self._elements
+        if not elements:
+            return []
+        return elements[0].driver.execute_script(_TEXT_SCRIPT, elements)
 
-    # 이거 프로퍼티로 바꿔야함 element 따라서
+    # up / down / left / right는 요소마다 요청하지 않고 execute_script 한 번으로 찾음
     @property
     def up(self):
-        return SwElements([element.up for element in self._elements])
+        return self._find_nth_each(_UP_XPATH, 0, strict=True)
 
     def down(self, index=0):
-        return SwElements([element.down[index] for element in self._elements])
+        return self._find_nth_each(_DOWN_XPATH, index, strict=True)
 
     def left(self, index=0):
-        return SwElements([element.left[index] for element in self._elements])
+        return self._find_nth_each(_LEFT_XPATH, index, strict=True)
 
     def right(self, index=0):
-        return SwElements([element.right[index] for element in self._elements])
+        return self._find_nth_each(_RIGHT_XPATH, index, strict=True)
 
     def find(
         self,
@@ -72,9 +204,23 @@ class SwElements:
         num: int | None = None,
         **kwargs: ExprStr,
     ):
-        xpath = xpath or generate_xpath(**locals())
+        # 빈 목록이면 xpath도 만들지 않음
+        if not self._items:
+            return SwElements([])
+
+        xpath = xpath or _build_xpath(
+            tag,
+            id,
+            id_contains,
+            class_name,
+            class_name_contains,
+            text,
+            text_contains,
+            {"name": name, "num": num, **kwargs},
+            axis,
+        )
 
-        return SwElements([element.find(xpath) for element in self._elements])
+        return self._find_each(xpath)
 
     def find_or_none(
         self,
@@ -91,32 +237,70 @@ class SwElements:
         text_contains: ExprStr | None = None,
         **kwargs: ExprStr,
     ):
-        xpath = xpath or generate_xpath(**locals())
+        # 빈 목록이면 xpath도 만들지 않음
+        if not self._items:
+            return SwElements([])
+
+        xpath = xpath or _build_xpath(
+            tag,
+            id,
+            id_contains,
+            class_name,
+            class_name_contains,
+            text,
+            text_contains,
+            kwargs,
+            axis,
+        )
 
-        result: list[SwElement] = []
-        for element in self._elements:
-            if (e := element.find_or_none(xpath)) is not None:
-                result.append(e)
-        return SwElements(result)
+        return self._find_first_each(xpath)
 
     def click(self, by: Literal["enter", "js", "mouse"] = "enter"):
-        for element in self._elements:
-            element.click(by)
+        """요소들을 클릭합니다.
+        by="js"는 execute_script 한 번으로 모두 클릭하고,
+        by="mouse"는 요소마다 ActionChains로 클릭함.
+        """
+        elements = self._elements
+        if not elements:
+            return
+        driver = elements[0].driver
+        # 클릭으로 페이지가 바뀔 수 있으므로 find 캐시를 한 번만 비움
+        driver.clear_cache()
+        _CLICK_ALL_ACTIONS[by](driver, elements)
+
+    def send_keys(self, keys: str | list[str], by: Literal["keys", "js"] = "keys"):
+        """요소들에 keys를 입력합니다. (list면 요소마다 하나씩)
+        by="js"면 텍스트 input / textarea는 execute_script 한 번으로 값을 이어
+        붙이고 input, change 이벤트만 발생시킴.
+        -> 키 이벤트, maxlength, 상호작용 가능 여부는 무시됨
+        특수 키(Keys.ENTER 등)가 있거나 그 외의 요소는 하나씩 send_keys로 입력함.
+        """
+        elements = self._elements
+        texts = [keys] * len(elements) if isinstance(keys, str) else list(keys)
+        elements, texts = elements[: len(texts)], texts[: len(elements)]
+        if not elements:
+            return
 
-    def send_keys(self, keys: str | list[str]):
-        if isinstance(keys, str):
-            for element in self._elements:
-                element.send_keys(keys)
+        if by == "keys" or any(_SPECIAL_KEY_PATTERN.search(text) for text in texts):
+            for element, text in zip(elements, texts):
+                element.send_keys(text)
+            return
 
-        else:
-            for element, key in zip(self._elements, keys):
-                element.send_keys(key)
+        skipped = elements[0].driver.execute_script(_SEND_KEYS_SCRIPT, elements, texts)
+        for index in skipped:
+            elements[index].send_keys(texts[index])
 
     def get_attribute(
         self,
         name: str,
     ):
-        return [element.get_attribute(name) for element in self._elements]
+        """요소들의 속성 값을 execute_script 한 번으로 가져옵니다."""
+        elements = self._elements
+        if not elements:
+            return []
+        return elements[0].driver.execute_script(
+            _get_attribute_script(), elements, name
+        )
 
     def filter(
         self,
@@ -133,14 +317,23 @@ class SwElements:
     ):
         """find(axis="self")와 동일함"""
 
-        xpath = xpath or generate_xpath(**locals(), axis="self")
-
-        result: list[SwElement] = []
-        for element in self._elements:
-            if (e := element.find_or_none(xpath)) is not None:
-                result.append(e)
+        # 빈 목록이면 xpath도 만들지 않음
+        if not self._items:
+            return SwElements([])
+
+        xpath = xpath or _build_xpath(
+            tag,
+            id,
+            id_contains,
+            class_name,
+            class_name_contains,
+            text,
+            text_contains,
+            kwargs,
+            "self",
+        )
 
-        return SwElements(result)
+        return self._find_first_each(xpath)
 
     def wait(
         self,
@@ -184,8 +377,87 @@ class SwElements:
 
         """
 
-        self._elements[0].driver.wait(
+        self[0].driver.wait(
             dur=dur, until=until, korean_year=korean_year, display=display
         )
 
         return self
+
+    @property
+    def _elements(self) -> list[SwElement]:
+        # 전체 요소가 필요한 경우에는 한 번에 모두 감쌈
+        if self._xpath is not None:
+            for index in range(len(self._items)):
+                self._get(index)
+            self._xpath = None
+        return self._items
+
+    def _get(self, index: int) -> SwElement:
+        item = self._items[index]
+        if self._xpath is not None and not isinstance(item, _element.SwElement):
+            item = self._items[index] = _element.SwElement(item, self._xpath)
+        return item
+
+    def _find_each(self, xpath: str) -> SwElements:
+        """요소마다 xpath로 첫 번째 요소를 찾아서 반환합니다. (SwElement.find와 동일)
+        요소마다 find를 요청하지 않고, 모두 찾을 때까지 execute_script 한 번씩 재시도함.
+        """
+        elements = self._elements
+        if not elements:
+            return SwElements([])
+        driver = elements[0].driver
+
+        def find_all_once():
+            found = driver.execute_script(_FIND_NTH_EACH_SCRIPT, elements, xpath, 0)
+            if None in found:
+                element = elements[found.index(None)]
+                msg = f"\n**Element not found**\nfull_xpath='{element.xpath}/{xpath}'\n"
+                raise NoSuchElementException(msg)
+            return found
+
+        try:
+            found = driver.retry(find_all_once)
+        except NoSuchElementException:
+            if not driver.debug:
+                raise
+            # 디버그 모드에서는 요소마다 찾으면서 context_finder로 찾아봄
+            return SwElements([element.find(xpath) for element in elements])
+
+        return SwElements(
+            [
+                _element.SwElement(child, f"{element.xpath}/{xpath}")
+                for element, child in zip(elements, found)
+            ]
+        )
+
+    def _find_first_each(self, xpath: str) -> SwElements:
+        """요소마다 xpath로 첫 번째 요소를 찾아서, 찾은 것들만 모아 반환합니다."""
+        return self._find_nth_each(xpath, 0)
+
+    def _find_nth_each(self, xpath: str, index: int, *, strict=False) -> SwElements:
+        """요소마다 xpath로 index번째 요소를 찾아서, 찾은 것들만 모아 반환합니다.
+        요소마다 따로 요청하지 않고 execute_script 한 번으로 찾음.
+        strict=True면 하나라도 없을 때 IndexError를 발생시킴.
+        """
+        elements = self._elements
+        if not elements:
+            return SwElements([])
+
+        found = elements[0].driver.execute_script(
+            _FIND_NTH_EACH_SCRIPT, elements, xpath, index
+        )
+        if strict and None in found:
+            msg = f"{xpath}의 {index}번째 요소가 없는 요소가 있습니다."
+            raise IndexError(msg)
+        return SwElements(
+            [
+                _element.SwElement(child, f"{element.xpath}/{xpath}")
+                for element, child in zip(elements, found)
+                if child is not None
+            ]
+        )
+
+
+# element.py가 이 모듈을 import하므로 모듈이 다 정의된 뒤에 import함
+# -> 어느 쪽을 먼저 import해도 순환 import가 되지 않음
+from . import element as _element  # noqa: E402
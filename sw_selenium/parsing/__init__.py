@@ -1,5 +1,10 @@
 from .captcha_parser import decipher_captcha
 from .dateutil_parser.dateutil_parser import convert_date_string
-from .xpath_parser import generate_xpath
+from .xpath_parser import clear_xpath_cache, generate_xpath
 
-__all__ = ["convert_date_string", "decipher_captcha", "generate_xpath"]
+__all__ = [
+    "clear_xpath_cache",
+    "convert_date_string",
+    "decipher_captcha",
+    "generate_xpath",
+]
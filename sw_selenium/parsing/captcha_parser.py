@@ -1,17 +1,30 @@
 from __future__ import annotations
 
+from functools import cache
 from typing import TYPE_CHECKING
 
-from sw_selenium.utils.lazy_import import LazyImport
+from sw_selenium.utils.lazy_import import lazy_import
 
 if TYPE_CHECKING:
     import cv2 as cv  # type: ignore[import]
     import numpy as np  # type: ignore[import]
     from pytesseract import image_to_string  # type: ignore[import]
 else:
-    cv = LazyImport("cv2", "opencv-python")
-    np = LazyImport("numpy")
-    image_to_string = LazyImport("pytesseract", "image_to_string")
+    cv = lazy_import("cv2", "opencv-python")
+    np = lazy_import("numpy")
+    image_to_string = lazy_import("pytesseract", "image_to_string")
+
+_NOISE_AREA = 50
+"""이 넓이(픽셀 수)보다 작은 덩어리는 노이즈로 보고 지움"""
+
+_TESSERACT_CONFIG = "--oem 1 --psm 7 -c tessedit_char_whitelist=0123456789"
+"""숫자로 된 한 줄짜리 캡챠 -> 페이지 레이아웃 분석을 건너뛰고 LSTM 엔진, 숫자만 인식"""
+
+
+@cache
+def _sharpen_kernel():
+    # numpy를 lazy import하므로 처음 쓸 때 한 번만 만듦
+    return np.array([[-1, -1, -1], [-1, 9, -1], [-1, -1, -1]])
 
 
 def decipher_captcha(captcha_img: bytes) -> str:
@@ -29,14 +42,10 @@ def decipher_captcha(captcha_img: bytes) -> str:
     )
     kernel = cv.getStructuringElement(cv.MORPH_RECT, (3, 3))
     image = cv.morphologyEx(image, cv.MORPH_OPEN, kernel, iterations=1)
-    cnts, _ = cv.findContours(image, cv.RETR_EXTERNAL, cv.CHAIN_APPROX_SIMPLE)
-    cnts = cnts[0] if len(cnts) == 2 else cnts[1]  # noqa: PLR2004
-    for c in cnts:
-        area = cv.contourArea(c)
-        if area < 50:  # noqa: PLR2004
-            cv.drawContours(image, [c], -1, (0, 0, 0), -1)
-    kernel2 = np.array([[-1, -1, -1], [-1, 9, -1], [-1, -1, -1]])
-    image = cv.filter2D(image, -1, kernel2)
+    # 작은 점(노이즈)들을 지움 -> 윤곽선마다 반복하지 않고 한 번에 라벨링해서 지움
+    _, labels, stats, _ = cv.connectedComponentsWithStats(image, connectivity=8)
+    image[stats[labels, cv.CC_STAT_AREA] < _NOISE_AREA] = 0
+    image = cv.filter2D(image, -1, _sharpen_kernel())
     result = 255 - image
 
-    return image_to_string(result)
+    return image_to_string(result, config=_TESSERACT_CONFIG)
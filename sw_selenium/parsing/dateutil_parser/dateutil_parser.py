@@ -1,61 +1,83 @@
+from __future__ import annotations
+
 import csv
 import re
+from datetime import date, datetime
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from sw_selenium.utils.lazy_import import LazyImport
+from sw_selenium.utils.lazy_import import lazy_import
 
 if TYPE_CHECKING:
     from dateutil import parser  # type: ignore[import]
 else:
-    parser = LazyImport("dateutil", "parser", "python-dateutil")
+    parser = lazy_import("dateutil.parser", pip_name="python-dateutil")
 
 
 # CSV 파일을 읽어와서 번역 테이블을 딕셔너리로 변환
 def _load_translation_table(csv_file: Path) -> dict:
-    translation_table = {}
-    with csv_file.open(encoding="utf-8") as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            korean = row["korean"]
-            english = row["english"]
-            translation_table[korean] = english
-    return translation_table
+    with csv_file.open(encoding="utf-8", newline="") as file:
+        reader = csv.reader(file)
+        # 행마다 dict를 만들지 않도록 헤더에서 열 위치만 찾아 둠
+        header = next(reader)
+        korean, english = header.index("korean"), header.index("english")
+        return {row[korean]: row[english] for row in reader}
+
+
+# "오전 n시" / "오후 n시" 패턴 (호출마다 컴파일하지 않도록 미리 컴파일)
+_MERIDIEM_PATTERN = re.compile(r"(오전|오후) (\d+)시")
 
 
 def _rearrange_time(text: str) -> str:
     """정규식을 사용하여 "오전 n시"를 "n시 오전"으로 변환하는 함수"""
 
-    # "오전 n시" 패턴을 "n시 오전"으로 변환
-    text = re.sub(r"오전 (\d+)시", r"\1시 오전", text)
-    # "오후 n시" 패턴을 "n시 오후"로 변환
-    text = re.sub(r"오후 (\d+)시", r"\1시 오후", text)
-    return text
+    # "오전 n시" -> "n시 오전", "오후 n시" -> "n시 오후"
+    return _MERIDIEM_PATTERN.sub(r"\2시 \1", text)
 
 
 # 번역 함수 작성
-def _translate_korean_to_english(text: str, translation_table: dict) -> str:
-    for korean, english in translation_table.items():
-        text = text.replace(korean, english)
+def _translate_korean_to_english(text: str) -> str:
+    # 테이블 단어마다 replace를 하지 않고, 미리 묶어둔 정규식으로 한 번에 치환함
+    # (같은 위치에서는 테이블 앞쪽 단어가 우선 -> "11월"이 "1월"로 먼저 바뀌지 않음)
+    translation_table, translation_pattern = _get_translation()
+    return translation_pattern.sub(lambda match: translation_table[match.group()], text)
+
 
-    return text
+# 현재 파일의 디렉토리 경로를 얻습니다.
+csv_file_path = Path(__file__).parent / "kr_to_en_table.csv"
 
 
 # 번역 테이블 로드
+# import할 때 CSV를 읽지 않고, 처음 번역할 때 한 번만 읽음
+@cache
+def _get_translation() -> tuple[dict, re.Pattern]:
+    translation_table = _load_translation_table(csv_file_path.resolve())
+    translation_pattern = re.compile("|".join(map(re.escape, translation_table)))
+    return translation_table, translation_pattern
 
-# 현재 파일의 디렉토리 경로를 얻습니다.
-csv_file_path = Path(__file__).parent / "kr_to_en_table.csv"
 
-# 파일의 절대 경로를 계산합니다.
+def convert_date_string(
+    date_str: str, *, korean_year=False, today: date | None = None
+) -> datetime:
+    """한국어나 영어로 된 날짜 문자열을 파싱하는 함수
 
-translation_table = _load_translation_table(csv_file_path.resolve())
+    today: 날짜가 빠진 문자열의 기준 날짜. 기본값은 오늘.
+    """
+    # 날짜가 빠진 문자열은 오늘 날짜로 채워지므로 오늘 날짜도 캐시 키에 포함
+    return _convert_date_string_cached(date_str, korean_year, today or date.today())
 
 
-def convert_date_string(date_str: str, *, korean_year=False):
-    """한국어나 영어로 된 날짜 문자열을 파싱하는 함수"""
+@lru_cache(maxsize=256)
+def _convert_date_string_cached(
+    date_str: str, korean_year: bool, today: date
+) -> datetime:
     date_str = _rearrange_time(date_str)
-    translated_date = _translate_korean_to_english(date_str, translation_table)
-    return parser.parse(translated_date, yearfirst=korean_year)
+    translated_date = _translate_korean_to_english(date_str)
+    # parser.parse는 모듈에 있는 기본 parser 객체를 재사용함
+    # 빠진 날짜 부분은 today로 채움 (dateutil의 기본값과 같음)
+    default = datetime.combine(today, datetime.min.time())
+    return parser.parse(translated_date, default=default, yearfirst=korean_year)
 
 
 """
@@ -64,7 +86,7 @@ TEST CODE
 if __name__ == "__main__":
     date_string = "00/11/27 2:0:0.1"
     date_string = _rearrange_time(date_string)
-    translated_date = _translate_korean_to_english(date_string, translation_table)
+    translated_date = _translate_korean_to_english(date_string)
     print(translated_date)
     parsed_date = parser.parse(translated_date, yearfirst=True)
     print(parsed_date)
@@ -1,20 +1,8 @@
 from __future__ import annotations
 
-from typing import Literal
-
-from pyparsing import (
-    Combine,
-    OneOrMore,
-    QuotedString,
-    Suppress,
-    White,
-    Word,
-    ZeroOrMore,
-    infix_notation,
-    one_of,
-    opAssoc,
-    pyparsing_unicode,
-)
+import re
+from functools import lru_cache
+from typing import Any, Literal
 
 AxisStr = Literal[
     "ancestor",
@@ -51,24 +39,18 @@ Supported operators:
 """
 
 
-# Define the grammar
-_word = Word(pyparsing_unicode.alphanums + "_-.")
-_identifier = (
-    Combine(OneOrMore(_word + ZeroOrMore(White() + _word)))
-    | QuotedString('"')
-    | QuotedString("'")
-)
-
-# Define the expression using infix_notation
-_expr = infix_notation(
-    _identifier,
-    [("!", 1, opAssoc.RIGHT), (one_of("& |"), 2, opAssoc.LEFT)],
-    lpar=Suppress("("),
-    rpar=Suppress(")"),
+# 토큰: 연산자(| & ! 괄호), 따옴표로 감싼 문자열, 공백으로 이어진 단어들
+_TOKEN_PATTERN = re.compile(
+    r"""\s*(?:([|&!()])|"([^"]*)"|'([^']*)'|([\w.\-]+(?:\s+[\w.\-]+)*))"""
 )
 
 
 def _get_prop_format(prop_name: str):
+    return _BUILTIN_PROP_FORMATS.get(prop_name) or _build_prop_format(prop_name)
+
+
+@lru_cache(maxsize=256)
+def _build_prop_format(prop_name: str):
     prop_name = prop_name.replace("class_name", "class")
     if "text" in prop_name:
         prop_name = prop_name.replace("text", "text()")
@@ -85,55 +67,114 @@ def _get_prop_format(prop_name: str):
     return prop_name + "='{}'"
 
 
-def _preprocess_for_not(node: list):
-    for i in range(len(node)):
-        if isinstance(node[i], list):
-            _preprocess_for_not(node[i])
-        elif i > 0 and node[i - 1] == "!":
-            node[i] = [node[i]]
+# find 계열 메서드의 기본 인자들은 미리 만들어 둠 -> 문자열 검사 없이 바로 찾음
+_BUILTIN_PROP_FORMATS = {
+    name: _build_prop_format.__wrapped__(name)
+    for name in (
+        "id",
+        "id_contains",
+        "name",
+        "class_name",
+        "class_name_contains",
+        "text",
+        "text_contains",
+        "num",
+    )
+}
 
 
 # Parse the expression
-def _parse_expression(expression: str, prop_name: str):
-    parsed_expression = _expr.parse_string(expression, parse_all=True).as_list()[0]
-
-    # A -> (A) 로 바꾸기 -> 마지막에 괄호 없애는 과정 통일
-    if isinstance(parsed_expression, str):
-        parsed_expression = [parsed_expression]
-
-    _preprocess_for_not(parsed_expression)
-
+# 같은 (expression, prop_name) 쌍이 반복되므로 결과를 캐시함
+@lru_cache(maxsize=2048)
+def _parse_expression(expression: str, prop_name: str) -> tuple[str, bool]:
+    """!, 괄호, |, &로 된 식을 (XPath 조각, 괄호가 필요한지)로 변환합니다.
+    재귀 대신 열린 괄호마다 스택에 쌓아서 토큰을 한 번만 훑음.
+    """
     prop_format = _get_prop_format(prop_name)
-    logical_expression = _convert_to_logical_expression(parsed_expression, prop_format)
-    if logical_expression[0] == "(":
-        logical_expression = logical_expression[1:-1]
-    return logical_expression
-
-
-def _convert_to_logical_expression(element: str | list, prop_format: str) -> str:
-    if isinstance(element, list):
-        result = ""
-        if element[0] != "!":
-            result += "("
-
-        result += "".join(
-            _convert_to_logical_expression(sub_element, prop_format)
-            for sub_element in element
-        )
-
-        if element[0] != "!":
-            result += ")"
-
-        return result
-
-    if element == "|":
-        return " or "
-    if element == "&":
-        return " and "
-    if element == "!":
-        return "not"
+    # 괄호 하나 = (피연산자 목록, 연산자 목록, 괄호 앞에 붙은 ! 개수)
+    stack: list[tuple[list, list, int]] = []
+    operands: list[tuple[str, bool]] = []
+    operators: list[str] = []
+    nots = 0
+    expect_operand = True
+    for kind, value in _tokenize(expression):
+        if expect_operand and kind == "!":
+            nots += 1
+            continue
+        if expect_operand and kind == "(":
+            stack.append((operands, operators, nots))
+            operands, operators, nots = [], [], 0
+            continue
 
-    return prop_format.format(element)
+        if expect_operand and kind == "id":
+            operand, compound = prop_format.format(value), False
+        elif not expect_operand and kind in ("|", "&"):
+            operators.append(" or " if kind == "|" else " and ")
+            expect_operand = True
+            continue
+        elif not expect_operand and kind == ")" and stack:
+            operand, compound = _join_operands(operands, operators)
+            operands, operators, nots = stack.pop()
+        else:
+            msg = f"Invalid expression: {expression!r}"
+            raise ValueError(msg)
+
+        # !는 괄호 없이 그대로 감쌈 -> not(a or b)
+        for _ in range(nots):
+            operand, compound = f"not({operand})", False
+        operands.append((operand, compound))
+        nots = 0
+        expect_operand = False
+
+    if expect_operand or stack:
+        msg = f"Invalid expression: {expression!r}"
+        raise ValueError(msg)
+    # 최상위 식은 괄호로 감싸지 않음 -> 감쌀지는 쓰는 쪽에서 결정
+    return _join_operands(operands, operators)
+
+
+def _tokenize(expression: str) -> list[tuple[str, str]]:
+    """식을 (종류, 값) 토큰 목록으로 나눔. 종류는 연산자 문자 또는 "id"."""
+    tokens = []
+    pos, end = 0, len(expression.rstrip())
+    while pos < end:
+        match = _TOKEN_PATTERN.match(expression, pos)
+        if match is None:
+            msg = f"Invalid expression: {expression!r}"
+            raise ValueError(msg)
+        if match.lastindex == 1:
+            tokens.append((match[1], match[1]))
+        else:
+            tokens.append(("id", match[match.lastindex]))
+        pos = match.end()
+    return tokens
+
+
+def _join_operands(
+    operands: list[tuple[str, bool]], operators: list[str]
+) -> tuple[str, bool]:
+    """피연산자들을 연산자로 이어 붙임 -> (XPath 조각, 괄호가 필요한지)
+    |와 &는 우선순위가 같으므로 나온 순서대로 묶음. XPath에서는 and가 먼저이므로
+    연산자가 바뀔 때마다 앞부분을 괄호로 감쌈. ex) a | b & c -> (a or b) and c
+    피연산자가 하나면 괄호는 쓰는 쪽에서 결정함.
+    """
+    if len(operands) == 1:
+        return operands[0]
+
+    operand, compound = operands[0]
+    text = f"({operand})" if compound else operand
+    for i, (operand, compound) in enumerate(operands[1:]):
+        if i and operators[i] != operators[i - 1]:
+            text = f"({text})"
+        text += operators[i] + (f"({operand})" if compound else operand)
+    return text, True
+
+
+def clear_xpath_cache():
+    """Clear the caches used while generating XPath expressions."""
+    _build_prop_format.cache_clear()
+    _parse_expression.cache_clear()
+    _generate_xpath.cache_clear()
 
 
 def generate_xpath(**kwargs) -> str:
@@ -147,6 +188,49 @@ def generate_xpath(**kwargs) -> str:
     data.pop("self", "")
     data.pop("xpath", "")
     data.pop("delay", "")
+
+    return _generate_xpath_from_items(tuple(data.items()))
+
+
+def _build_xpath(
+    tag: str,
+    id: ExprStr | None,  # noqa: A002
+    id_contains: ExprStr | None,
+    class_name: ExprStr | None,
+    class_name_contains: ExprStr | None,
+    text: ExprStr | None,
+    text_contains: ExprStr | None,
+    kwargs: dict[str, Any],
+    axis: str = "//",
+) -> str:
+    """find 계열 메서드에서 locals()를 넘기지 않고 필요한 인자만으로 XPath를 만듦"""
+    items = (
+        ("axis", axis),
+        ("tag", tag),
+        ("id", id),
+        ("id_contains", id_contains),
+        ("class_name", class_name),
+        ("class_name_contains", class_name_contains),
+        ("text", text),
+        ("text_contains", text_contains),
+        *kwargs.items(),
+    )
+    return _generate_xpath_from_items(items)
+
+
+def _generate_xpath_from_items(items: tuple[tuple[str, Any], ...]) -> str:
+    # 같은 조건으로 반복해서 찾는 경우가 많으므로 결과를 캐시함
+    try:
+        hash(items)
+    except TypeError:
+        # hash할 수 없는 값이 들어온 경우는 캐시하지 않음
+        return _generate_xpath.__wrapped__(items)
+    return _generate_xpath(items)
+
+
+@lru_cache(maxsize=2048)
+def _generate_xpath(items: tuple[tuple[str, Any], ...]) -> str:
+    data = dict(items)
     # axis_map = {"": "//", "child": "/"}
 
     # axis = axis_map.get(data.pop("axis", ""), "") or data.pop("axis", "") + "::"
@@ -154,14 +238,17 @@ def generate_xpath(**kwargs) -> str:
     if axis != "//":
         axis += "::"
     header = axis + data.pop("tag", "*")
-    body = []
-    for key, value in data.items():
-        if value is None:
-            continue
-        body.append(_parse_expression(str(value), key))
-
+    parts = [
+        _parse_expression(str(value), key)
+        for key, value in data.items()
+        if value is not None
+    ]
+    # 여러 조건을 and로 묶을 때는 연산자가 있는 조건을 괄호로 감쌈
+    # ex) id="a | b", text="c" -> (@id='a' or @id='b') and text()='c'
+    wrap = len(parts) > 1
+    body = [f"({part})" if wrap and compound else part for part, compound in parts]
     if body:
-        return f"{header}[{ ' and '.join(body) }]"
+        return f"{header}[{' and '.join(body)}]"
     else:
         return header
 
@@ -180,5 +267,5 @@ A B C -> 는 "A B C" 로 입력되게 했구요.
 if __name__ == "__main__":
     expression = "A & B  C "
     prop_format = "text"
-    result = _parse_expression(expression, prop_format)
+    result, _ = _parse_expression(expression, prop_format)
     print(result)
@@ -3,14 +3,14 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable, Literal, TypeVar
 
-from sw_selenium.utils.lazy_import import LazyImport
+from sw_selenium.utils.lazy_import import lazy_import
 
 if TYPE_CHECKING:
     import tkinter as tk
     from tkinter import simpledialog
 else:
-    tk = LazyImport("tkinter", pip_name="tk")
-    simpledialog = LazyImport("tkinter.simpledialog")
+    tk = lazy_import("tkinter", pip_name="tk")
+    simpledialog = lazy_import("tkinter.simpledialog")
 
 T = TypeVar("T", str, int, float)
 
@@ -1,3 +1,3 @@
-from .lazy_import import LazyImport
+from .lazy_import import LazyImport, lazy_import
 
-__all__ = ["LazyImport"]
+__all__ = ["LazyImport", "lazy_import"]
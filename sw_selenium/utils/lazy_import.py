@@ -1,13 +1,44 @@
 from __future__ import annotations
 
 import importlib
+import os
+import sys
+import warnings
+from operator import attrgetter
+from typing import Iterable
+
+_EAGER_IMPORT = os.environ.get("SW_SELENIUM_EAGER_IMPORT", "") not in ("", "0")
+"""SW_SELENIUM_EAGER_IMPORT 환경변수가 켜져 있으면 LazyImport를 만들 때 바로 import함.
+(서버리스처럼 첫 요청 지연이 싫은 환경에서 import 비용을 시작할 때 미리 냄)"""
 
 
 class LazyImport:
+    """모듈(이나 모듈의 함수)을 처음 쓸 때 import하는 대리 객체.
+
+    타입 검사기는 대리 객체의 타입을 모름 -> TYPE_CHECKING일 때만 진짜 import:
+
+        if TYPE_CHECKING:
+            from math import pow, sqrt
+        else:
+            sqrt, pow = lazy_import("math", ["sqrt", "pow"])
+    """
+
+    # __dict__는 __getattr__에서 가져온 모듈 속성을 저장할 때만 씀
+    __slots__ = (
+        "module_name",
+        "func_names",
+        "pip_name",
+        "module",
+        "_getter",
+        "_import_error",
+        "_missing_msg",
+        "__dict__",
+    )
+
     def __init__(
         self,
         module_name: str,
-        func_names: str | list[str] | None = None,
+        func_names: str | Iterable[str] | None = None,
         pip_name: str | None = None,
     ):
         """Initialize the LazyImport instance.
@@ -15,60 +46,133 @@ class LazyImport:
         Parameters
         ----------
         module_name (str): The name of the module to be lazily imported.
-        func_names (str or list of str, optional): The name(s) of the function(s) to be lazily imported. Defaults to None.
+        func_names (str or iterable of str, optional): The name(s) of the function(s) to be lazily imported. Defaults to None.
         pip_name (str, optional): The name of the pip package to be installed if the module is not found. Defaults to None.
         """
         self.module_name = module_name
         if func_names is None:
-            self.func_names = []
+            self.func_names = ()
+        elif isinstance(func_names, str):
+            self.func_names = (func_names,)
         else:
-            self.func_names = (
-                func_names if isinstance(func_names, list) else [func_names]
-            )
+            self.func_names = tuple(func_names)
+        # 언패킹용 -> 함수가 여러 개면 C로 구현된 attrgetter로 한 번에 꺼냄
+        self._getter = (
+            attrgetter(*self.func_names) if len(self.func_names) > 1 else None
+        )
         self.pip_name = pip_name
         self.module = None
-        self.funcs = {}
+        # import 실패 원인 -> 다시 import를 시도하지 않고 바로 ImportError 발생
+        self._import_error = None
+        self._missing_msg = f"Module '{module_name}' not found"
+        if _EAGER_IMPORT:
+            self._preload()
 
     def __getattr__(self, name):
-        if self.module is None:
-            try:
-                self.module = importlib.import_module(self.module_name)
-            except ModuleNotFoundError as e:
-                if self.pip_name:
-                    print(
-                        f"Module '{self.module_name}' not found. You can install it using 'pip install {self.pip_name}'"
-                    )
-                msg = f"Module '{self.module_name}' not found"
-                raise ImportError(msg) from e
-        return getattr(self.module, name)
+        attr = getattr(self._resolve_module(), name)
+        # 인스턴스 속성으로 저장 -> 다음부터는 __getattr__을 거치지 않고 바로 찾음
+        setattr(self, name, attr)
+        return attr
 
     def __call__(self, *args, **kwargs):
-        if not self.func_names or len(self.func_names) != 1:
+        # 처음 호출할 때만 여기로 옴 -> 이후는 _bind_call로 바꾼 __call__이 바로 호출
+        func = self._resolve_func()
+        self._bind_call(func)
+        return func(*args, **kwargs)
+
+    def __iter__(self):
+        if not self.func_names:
+            msg = "Function names not provided"
+            raise AttributeError(msg)
+        # 언패킹할 때는 어차피 전부 필요함 -> 모듈에서 한 번에 꺼냄
+        module = self._resolve_module()
+        if self._getter is None:
+            return iter((getattr(module, self.func_names[0]),))
+        return iter(self._getter(module))
+
+    def _resolve_func(self):
+        """func_names에 있는 하나뿐인 함수를 가져옵니다."""
+        if len(self.func_names) != 1:
             msg = "Single function name not provided or multiple functions provided"
             raise AttributeError(msg)
         func_name = self.func_names[0]
-        if func_name not in self.funcs:
+        try:
+            return getattr(self._resolve_module(), func_name)
+        except AttributeError as e:
+            msg = f"Function '{func_name}' not found in module '{self.module_name}'"
+            raise ImportError(msg) from e
+
+    def _resolve_module(self):
+        """모듈을 import해서 반환합니다. 없으면 설치 안내를 출력하고 ImportError 발생."""
+        if self.module is None:
+            if self._import_error is not None:
+                raise ImportError(self._missing_msg) from self._import_error
             try:
-                self.module = importlib.import_module(self.module_name)
-                self.funcs[func_name] = getattr(self.module, func_name)
+                # 이미 import된 모듈이면 import 시스템을 거치지 않음
+                self.module = sys.modules.get(
+                    self.module_name
+                ) or importlib.import_module(self.module_name)
             except ModuleNotFoundError as e:
+                self._import_error = e
                 if self.pip_name:
-                    print(
-                        f"Module '{self.module_name}' not found. You can install it using 'pip install {self.pip_name}'"
+                    # ImportWarning은 기본적으로 숨겨짐 -> 기본 UserWarning으로 보여줌
+                    warnings.warn(
+                        f"Module '{self.module_name}' not found; install via 'pip install {self.pip_name}'",
+                        stacklevel=3,
                     )
-                msg = f"Module '{self.module_name}' not found"
-                raise ImportError(msg) from e
-            except AttributeError as e:
-                msg = f"Function '{func_name}' not found in module '{self.module_name}'"
-                raise ImportError(msg) from e
-        return self.funcs[func_name](*args, **kwargs)
+                raise ImportError(self._missing_msg) from e
+        return self.module
 
-    def __iter__(self):
-        if not self.func_names:
-            msg = "Function names not provided"
-            raise AttributeError(msg)
+    def _preload(self):
+        """모듈과 함수를 미리 가져옵니다. 실패하면 넘어가고 처음 쓸 때 다시 시도함."""
+        try:
+            module = importlib.import_module(self.module_name)
+        except ImportError:
+            return
+        self.module = module
         for func_name in self.func_names:
-            yield self.__getattr__(func_name)
+            if hasattr(module, func_name):
+                # __getattr__과 같은 방식으로 인스턴스 속성에 저장
+                setattr(self, func_name, getattr(module, func_name))
+        if len(self.func_names) == 1 and self.func_names[0] in self.__dict__:
+            self._bind_call(self.__dict__[self.func_names[0]])
+
+    def _bind_call(self, func):
+        """호출하면 func를 바로 부르도록 이 인스턴스만의 하위 클래스로 바꿉니다.
+
+        __call__은 인스턴스가 아니라 클래스에서 찾음 -> 인스턴스 속성으로는 안 됨.
+        """
+        self.__class__ = type(
+            LazyImport.__name__,
+            (LazyImport,),
+            {"__slots__": (), "__call__": staticmethod(func)},
+        )
+
+
+_lazy_cache: dict[tuple, LazyImport] = {}
+"""lazy_import 캐시. (module_name, func_names, pip_name) -> LazyImport"""
+
+
+def lazy_import(
+    module_name: str,
+    func_names: str | Iterable[str] | None = None,
+    pip_name: str | None = None,
+) -> LazyImport:
+    """같은 인자면 같은 LazyImport 인스턴스를 반환합니다.
+
+    여러 곳에서 같은 모듈을 lazy import해도 import는 한 번만 일어남.
+    """
+    if func_names is None:
+        names = ()
+    elif isinstance(func_names, str):
+        names = (func_names,)
+    else:
+        names = tuple(func_names)
+    key = (module_name, names, pip_name)
+    instance = _lazy_cache.get(key)
+    if instance is None:
+        instance = _lazy_cache[key] = LazyImport(module_name, names, pip_name)
+    return instance
 
 
 # 사용 예시